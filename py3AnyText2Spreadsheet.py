@@ -11,6 +11,11 @@ py3AnyText2Spreadsheet acts as a proxy to call upon various types of parsing scr
 import resources.py3AnyText2Spreadsheet
 spreadsheet = resources.py3AnyText2Spreadsheet( 'resources\py3AnyText2Spreadsheet\resources\ks.kag3.kirikiri.parsingTemplate.py' )
 
+To call main() directly, pass it a dictionary with the same keys that createCommandLineOptions() returns. It is checked with validateUserInput() first unless userInput[ 'validated' ] == True.
+batchFileName, batchFileEncoding, and numberOfJobs are optional. If batchFileName is set, then main() processes every rawFile listed in it like --batch does, and rawFileName, spreadsheetFileName, and translatedRawFileName must be None.
+validateUserInput() sets userInput[ 'validated' ] = True, so a dictionary it already returned can be given to main() again without checking the files, detecting the encodings, and reading the character dictionary again.
+Anything validateUserInput() derived from rawFileName, like the encoding, line endings, and spreadsheet name, must be updated along with rawFileName.
+
 For cross language support of parsing files, this program should probably support something like: https://github.com/Distributive-Network/PythonMonkey
 Then again, Python is very easy to use.
 
@@ -29,13 +34,15 @@ defaultTextEncodingForKSFiles = 'shift-jis'      # UCS2 BOM LE (aka UTF-16 LE) m
 # shift-jis is a text encoding. In terms of ANSI code pages, it maps to cp932.
  
 parseSettingsExtension = '.ini'
+# These are the valid spellings of mode, in lowercase, and the mode each one means.
+modeAliases = { 'input' : 'input', 'in' : 'input', 'output' : 'output', 'out' : 'output' }
 supportedSpreadsheetExtensions = [ '.csv' , '.xlsx' , '.xls' , '.ods', '.tsv' ]
 defaultSpreadsheetExtension = '.xlsx'
 defaultOutputColumn = 4
-# This path is relative to py3AnyText2Spreadsheet.py
-tempParseScriptPathAndName = 'scratchpad/temp.py'   # Do not change this. This is associated with a hardcoded import statement pointing to scratchpad\temp.py It is not possible to make tempParseScriptPathAndName dynamic without importing an additional library which is more complicated to manage than just hardcoding this.
 
 inputErrorHandling = 'strict'
+# Translated files can be large, so use a 1 MB write buffer instead of the default of a few KB to write them with fewer system calls.
+outputFileBufferSize = 1048576
 #outputErrorHandling = 'namereplace'        #This is set dynamically below.
 
 unspecifiedError = 'Unspecified error in py3AnyText2Spreadsheet.py.'
@@ -43,15 +50,16 @@ usageHelp = ' Usage: python py3AnyText2Spreadsheet.py --help  Example: py3AnyTex
 
 
 # import stuff.
-import argparse                                                 # For command line options.
+#import argparse                                                 # For command line options. Imported in createCommandLineOptions() since it is not needed when main() is called as a library with a userInput dictionary.
 import sys                                                           # For sys.exit() and add library locations dynamically with sys.path.append().
 import os                                                            # Check if files and folders exist.
 import pathlib                                                     # Sane path handling.
-import csv                                                           # Used to read character dictionary.
-import shutil                                                        # Supports high-level copy operations. Used to copy script file to scratchpad temporary directory for importing.
-#import hashlib                                                      # TODO: Before copying, if the target exists, then read both files and compare their hash. Do not copy if their hashes match.
+import functools                                                   # Remember the results of reading files that have not changed when main() is called repeatedly as a library.
+import copy                                                       # Give each parsingProgram its own copy of the cached parseSettingsDictionary.
+import re                                                             # Build a single regular expression that matches every name in the character dictionary.
+import importlib.util                                             # Import the parsingProgram directly from its path, even if the file name is not a valid module name.
 
-import resources.chocolate as chocolate             # Main wrapper for openpyxl library. Used as core data structure.
+#import resources.chocolate as chocolate             # Main wrapper for openpyxl library. Used as core data structure. openpyxl is slow to import, so this is imported by importChocolate() only once it is needed.
 import resources.dealWithEncoding as dealWithEncoding # Handles text encoding and implements optional chardet library.
 import resources.functions as functions               # Has a lot of helper functions not directly related to this program's core logic.
 
@@ -62,10 +70,21 @@ import resources.functions as functions               # Has a lot of helper func
 # import chocolate
 
 #Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling = 'namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling = 'backslashreplace'    
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
+
+# This prints message to the console as text. Unlike print( message.encode( consoleEncoding ) ), it shows the text itself instead of the b'' representation of the bytes.
+# Characters the console cannot display are replaced using outputErrorHandling instead of crashing the program. That is only needed in the rare case that print() fails, so normally this is a single print() without any extra flushing.
+# resources/chocolate.py has the same function, so its messages look the same as these.
+def printToConsole( message ):
+    try:
+        print( message )
+    except UnicodeEncodeError:
+        stdoutEncoding = getattr( sys.stdout, 'encoding', None ) or consoleEncoding
+        print( message.encode( stdoutEncoding, errors=outputErrorHandling ).decode( stdoutEncoding ) )
+
+
+# This path never changes while the program is running, so only build it once.
+scriptDirectory = str( pathlib.Path( __file__ ).resolve().parent )
 
 # TODO:
 # Make program crash if character dictionary or another file is specified but not found.
@@ -73,10 +92,12 @@ elif sys.version_info.minor < 5:
 # Resolve other TODOs.
 
 def createCommandLineOptions():
+    import argparse
+
     commandLineParser = argparse.ArgumentParser( description='Description: Turns text files into spreadsheets using user-defined scripts. If mode is set to input, then parsingProgram.input() will be called. If mode is set to output, then parsingProgram.output() will be called.' + usageHelp )
     commandLineParser.add_argument( 'mode', help='Must be input or output.', type=str )
 
-    commandLineParser.add_argument( 'rawFile', help='Specify the text file to parse.', type=str )
+    commandLineParser.add_argument( 'rawFile', help='Specify the text file to parse. Not needed if --batch is used.', nargs='?', default=None, type=str )
     commandLineParser.add_argument( '-rfe','--rawFileEncoding', help='Specify the encoding of the rawFile.', default=None, type=str )
 
     commandLineParser.add_argument( 'parsingProgram', help='Specify the .py script that will be used to parse rawFile.', type=str )
@@ -96,6 +117,10 @@ def createCommandLineOptions():
 
     commandLineParser.add_argument( '-c', '--columnToUseForReplacements', help='Specify the column in the spreadsheet to use for replacements. Can be an integer starting with 1 or the name of the column header. Case sensitive. Only valid for mode=output.', default=None, type=str ) # This lacks a type= declaration. Is that needed? #Update: If no type declaration is used, then str is assumed. Just make it explicit then.
 
+    commandLineParser.add_argument( '-b', '--batch', help='Specify a text file that lists one rawFile per line to process every listed file using the same parsingProgram. Empty lines and lines starting with # are ignored. Cannot be used with rawFile, --spreadsheet, or --translatedRawFile.', default=None, type=str )
+    commandLineParser.add_argument( '-be', '--batchEncoding', help='Specify the encoding of the batch file.', default=None, type=str )
+    commandLineParser.add_argument( '-j', '--jobs', help='Only valid for --batch. Specify how many files to process at the same time using separate processes. Use 0 for one per CPU. Default=1.', default=1, type=int )
+
     commandLineParser.add_argument( '-t', '--testRun', help='Parse stuff, but do not write any output files.', action='store_true' )
     commandLineParser.add_argument( '-vb', '--verbose', help='Print more information.', action='store_true' )
     commandLineParser.add_argument( '-d', '--debug', help='Print too much information.', action='store_true' )
@@ -103,10 +128,14 @@ def createCommandLineOptions():
 
     commandLineArguments = commandLineParser.parse_args()
 
-    if commandLineArguments.version == True:
+    if commandLineArguments.version:
         print( __version__ )
         sys.exit( 0 )
 
+    if ( commandLineArguments.rawFile is None ) and ( commandLineArguments.batch is None ):
+        print( 'Error: Please specify a rawFile to parse or a --batch file.' + usageHelp )
+        sys.exit( 1 )
+
     userInput={}
     userInput[ 'mode' ] = commandLineArguments.mode
 
@@ -130,6 +159,10 @@ def createCommandLineOptions():
 
     userInput[ 'columnToUseForReplacements' ] = commandLineArguments.columnToUseForReplacements
 
+    userInput[ 'batchFileName' ] = commandLineArguments.batch
+    userInput[ 'batchFileEncoding' ] = commandLineArguments.batchEncoding
+    userInput[ 'numberOfJobs' ] = commandLineArguments.jobs
+
     userInput[ 'testRun' ] = commandLineArguments.testRun
     userInput[ 'verbose' ] = commandLineArguments.verbose
     userInput[ 'debug' ] = commandLineArguments.debug
@@ -137,59 +170,140 @@ def createCommandLineOptions():
     return userInput
 
 
+# These functions only depend upon the contents of the file they read, so remember the results for files that have not changed since they were last read.
+# The modification time and size of the file are part of the key, so editing the file makes the old result stale automatically.
+@functools.lru_cache( maxsize=128 )
+def _detectLineEndingsFromFile( fileNameWithPath, modifiedTime, fileSize, fileEncoding ):
+    return dealWithEncoding.detectLineEndingsFromFile( fileNameWithPath, fileEncoding )
+
+
+@functools.lru_cache( maxsize=128 )
+def _getDictionaryFromTextFile( fileNameWithPath, modifiedTime, fileSize, fileEncoding ):
+    return functions.getDictionaryFromTextFile( fileNameWithPath, fileEncoding )
+
+
+@functools.lru_cache( maxsize=128 )
+def _importDictionaryFromFile( fileNameWithPath, modifiedTime, fileSize, fileEncoding ):
+    myDictionary = functions.importDictionaryFromFile( fileNameWithPath, encoding=fileEncoding )
+    return ( myDictionary, getRegexForDictionaryKeys( myDictionary ) )
+
+
+# This returns a compiled regular expression that matches any key in myDictionary or None if there are no keys to match.
+# Longer keys are tried first, so a name is not matched by a shorter name that it starts with.
+def getRegexForDictionaryKeys( myDictionary ):
+    if myDictionary is None:
+        return None
+    keys = [ key for key in myDictionary if isinstance( key, str ) and ( key != '' ) ]
+    if len( keys ) == 0:
+        return None
+    keys.sort( key=len, reverse=True )
+    return re.compile( '|'.join( re.escape( key ) for key in keys ) )
+
+
+# This returns a tuple like ( 'windows', '\r\n' ) or ( 'unix', '\n' ) . The file is only read again if it changed since the last time.
+def getLineEndingsFromFile( fileName, fileEncoding ):
+    fileNameWithPath = os.path.abspath( fileName )
+    fileStatus = os.stat( fileNameWithPath )
+    return _detectLineEndingsFromFile( fileNameWithPath, fileStatus.st_mtime_ns, fileStatus.st_size, fileEncoding )
+
+
+# This returns a dictionary of the contents of a parseSettingsFile. The file is only read again if it changed since the last time.
+# Return a deep copy so the parsingProgram cannot alter the cached version. Some values, like ignoreLinesThatStartWith, are lists, and a shallow copy would still share them with the cache.
+def getDictionaryFromParseSettingsFile( fileName, fileEncoding ):
+    fileNameWithPath = os.path.abspath( fileName )
+    fileStatus = os.stat( fileNameWithPath )
+    parseSettingsDictionary = _getDictionaryFromTextFile( fileNameWithPath, fileStatus.st_mtime_ns, fileStatus.st_size, fileEncoding )
+    if parseSettingsDictionary is None:
+        return None
+    return copy.deepcopy( parseSettingsDictionary )
+
+
+# This returns a tuple of the characterDictionary read from fileName and a regular expression that matches its keys from getRegexForDictionaryKeys().
+# The file is only read again if it changed since the last time, so batch mode and repeated calls to main() only parse it and build the regular expression once.
+# Return a copy of the dictionary so the parsingProgram cannot alter the cached version.
+def getCharacterDictionaryFromFile( fileName, fileEncoding ):
+    fileNameWithPath = os.path.abspath( fileName )
+    fileStatus = os.stat( fileNameWithPath )
+    characterDictionary, characterDictionaryRegex = _importDictionaryFromFile( fileNameWithPath, fileStatus.st_mtime_ns, fileStatus.st_size, fileEncoding )
+    if characterDictionary is None:
+        return ( None, None )
+    return ( characterDictionary.copy(), characterDictionaryRegex )
+
+
+# This returns True if fileName is an existing file. Each path is only checked once per fileStatusCache dictionary, so paths that are validated more than once, like the parsingProgram in batch mode, do not keep asking the file system.
+def checkIfThisFileExistsCached( fileName, fileStatusCache ):
+    if fileName is None:
+        return False
+    if fileName not in fileStatusCache:
+        fileStatusCache[ fileName ] = os.path.isfile( fileName )
+    return fileStatusCache[ fileName ]
+
+
+# Errors out if fileName does not exist.
+def verifyThisFileExistsCached( fileName, fileStatusCache ):
+    if fileName is None:
+        print( 'Error: Please specify a valid file.' )
+        sys.exit( 1 )
+    if not checkIfThisFileExistsCached( fileName, fileStatusCache ):
+        printToConsole( 'Error: Unable to find file \'' + str( fileName ) + '\' ' )
+        sys.exit( 1 )
+
+
 # This should also read in all of the input files.
-def validateUserInput( userInput ):
+# fileStatusCache is a dictionary of which files exist. It only needs to be shared between calls for files that this program does not create or remove, so a new one is used by default.
+def validateUserInput( userInput, fileStatusCache=None ):
     global verbose
     verbose = userInput[ 'verbose' ]
     global debug
     debug = userInput[ 'debug' ]
 
-    if userInput[ 'mode' ].lower() == 'input':
-        userInput[ 'mode' ] = 'input'
-    elif userInput[ 'mode' ].lower() == 'in':
-        userInput[ 'mode' ] = 'input'
-    elif userInput[ 'mode' ].lower() == 'output':
-        userInput[ 'mode' ] = 'output'
-    elif userInput[ 'mode' ].lower() == 'out':
-        userInput[ 'mode' ] = 'output'
-    else:
-        print( ( 'Error: Mode must be input or output. Mode=' + userInput[ 'mode' ] ).encode(consoleEncoding) )
+    if fileStatusCache is None:
+        fileStatusCache = {}
+
+    mode = modeAliases.get( userInput[ 'mode' ].casefold() )
+    if mode is None:
+        printToConsole( 'Error: Mode must be input or output. Mode=' + userInput[ 'mode' ] )
         sys.exit( 1 )
+    userInput[ 'mode' ] = mode
 
-    functions.verifyThisFileExists( userInput[ 'rawFileName' ] )
-    functions.verifyThisFileExists( userInput[ 'parsingProgram' ] )
+    verifyThisFileExistsCached( userInput[ 'rawFileName' ], fileStatusCache )
+    # The extension of the rawFile is needed more than once below, so only split it out once.
+    rawFileExtension = os.path.splitext( userInput[ 'rawFileName' ] )[ 1 ]
+    verifyThisFileExistsCached( userInput[ 'parsingProgram' ], fileStatusCache )
 
-    if userInput[ 'parseSettingsFile' ] != None:
-        if functions.checkIfThisFileExists( userInput[ 'parseSettingsFile' ] ) == True:
+    if userInput[ 'parseSettingsFile' ] is not None:
+        if checkIfThisFileExistsCached( userInput[ 'parseSettingsFile' ], fileStatusCache ):
             pass
         else:
             print( 'Warning: The following parseSettingsFile was specified but does not exist:' )
-            print( ( userInput[ 'parseSettingsFile' ] ).encode(consoleEncoding) )
+            printToConsole( userInput[ 'parseSettingsFile' ] )
             userInput[ 'parseSettingsFile' ] = None
 
     if userInput[ 'mode' ] == 'input':
-        if userInput[ 'spreadsheetFileName' ] == None:
+        if userInput[ 'spreadsheetFileName' ] is None:
             print( 'Info: Spreadsheet file was not specified. Will create as: ' + defaultSpreadsheetExtension )
             userInput[ 'spreadsheetFileName' ] = userInput[ 'rawFileName' ] + defaultSpreadsheetExtension
             userInput[ 'spreadsheetExtension' ] = defaultSpreadsheetExtension
         #if userInput[ 'spreadsheetFileName' ] != None:
         else:
-            userInput[ 'spreadsheetExtension' ] = pathlib.Path( userInput[ 'spreadsheetFileName' ] ).suffix
+            userInput[ 'spreadsheetExtension' ] = os.path.splitext( userInput[ 'spreadsheetFileName' ] )[ 1 ]
 
         # Verify the extension is correct: .csv .xlsx .xls .ods .tsv
         # It is not entirely correct to call this userInput, but close enough.
         if userInput[ 'spreadsheetExtension'] in supportedSpreadsheetExtensions:
             pass
         else:
-            print( ('Error: Unsupported extension for spreadsheet: \'' + userInput[ 'spreadsheetExtension' ] + '\'' ).encode( consoleEncoding ) )
+            printToConsole( 'Error: Unsupported extension for spreadsheet: \'' + userInput[ 'spreadsheetExtension' ] + '\'' )
             print( 'Supported extensions=' + str( supportedSpreadsheetExtensions ) )
             sys.exit( 1 )
 
-        if functions.checkIfThisFileExists( userInput[ 'spreadsheetFileName' ] ) == True:
+        if checkIfThisFileExistsCached( userInput[ 'spreadsheetFileName' ], fileStatusCache ):
             # Rename to .backup because it will be replaced.
-            if userInput[ 'testRun' ] != True:
-                pathlib.Path( userInput[ 'spreadsheetFileName' ] ).replace( userInput[ 'spreadsheetFileName' ] + '.backup' + userInput[ 'spreadsheetExtension' ] )
-                print ( ( 'Info: '+ userInput[ 'spreadsheetFileName' ] + ' moved to ' + userInput[ 'spreadsheetFileName' ] + '.backup' + userInput[ 'spreadsheetExtension' ] ).encode( consoleEncoding ) )
+            if not userInput[ 'testRun' ]:
+                backupFileName = userInput[ 'spreadsheetFileName' ] + '.backup' + userInput[ 'spreadsheetExtension' ]
+                os.replace( userInput[ 'spreadsheetFileName' ], backupFileName )
+                fileStatusCache[ userInput[ 'spreadsheetFileName' ] ] = False
+                printToConsole( 'Info: '+ userInput[ 'spreadsheetFileName' ] + ' moved to ' + backupFileName )
         #elif functions.checkIfThisFileExists( userInput[ 'spreadsheetFileName' ] ) != True:
         #else:
         # Update: Then user specified an output file that does not exist yet. That makes sense. All is well.
@@ -197,64 +311,72 @@ def validateUserInput( userInput ):
 
     #elif userInput[ 'mode' ] == 'output':
     else:
-        if userInput[ 'spreadsheetFileName' ] == None:
-            print( 'Error: Please specify a valid spreadsheet from which to read translations.' )
-            sys.exit( 1 )
+        if userInput[ 'spreadsheetFileName' ] is None:
+            # Dictionaries passed to main() from other programs might not have batchFileName at all.
+            if userInput.get( 'batchFileName' ) is None:
+                print( 'Error: Please specify a valid spreadsheet from which to read translations.' )
+                sys.exit( 1 )
+            # In batch mode, use the same spreadsheet name that mode=input creates by default.
+            userInput[ 'spreadsheetFileName' ] = userInput[ 'rawFileName' ] + defaultSpreadsheetExtension
 
-        if functions.checkIfThisFileExists( userInput[ 'spreadsheetFileName' ] ) != True:
+        if not checkIfThisFileExistsCached( userInput[ 'spreadsheetFileName' ], fileStatusCache ):
             print( 'Error: The following spreadsheet file was specified but does not exist:' )
-            print( ( userInput[ 'spreadsheetFileName' ] ).encode( consoleEncoding ) )
+            printToConsole( userInput[ 'spreadsheetFileName' ] )
             sys.exit(1)            
 #        elif functions.checkIfThisFileExists( userInput[ 'spreadsheetFileName' ] ) == True:
 #        else:
                 # Then user specified an input file, and it exists. All is well. Do nothing here.
 #                pass
 
-        if userInput[ 'translatedRawFileName' ] == None:
+        if userInput[ 'translatedRawFileName' ] is None:
             # Then the user did not specify an output file.
             # What would be sane behavior here? Maybe just append translated.extension?
-            userInput[ 'translatedRawFileName' ] = userInput[ 'rawFileName' ] + '.translated' + pathlib.Path( userInput[ 'rawFileName'] ).suffix
+            userInput[ 'translatedRawFileName' ] = userInput[ 'rawFileName' ] + '.translated' + rawFileExtension
             print( 'Warning: No output file name was specified for the translated file. Using:')
-            print( userInput[ 'translatedRawFileName'].encode( consoleEncoding ) )
+            printToConsole( userInput[ 'translatedRawFileName'] )
 
     # This is about to be used, so map it now.
-    if userInput[ 'characterDictionaryEncoding' ] == None:
+    if userInput[ 'characterDictionaryEncoding' ] is None:
         userInput[ 'characterDictionaryEncoding' ] = defaultTextFileEncoding
 
-    if userInput[ 'characterDictionaryFileName' ] != None:
-        if functions.checkIfThisFileExists( userInput[ 'characterDictionaryFileName' ] ) == True:
+    if userInput[ 'characterDictionaryFileName' ] is not None:
+        if checkIfThisFileExistsCached( userInput[ 'characterDictionaryFileName' ], fileStatusCache ):
             # Read in characterDictionary.csv
-            userInput[ 'characterDictionary' ] = functions.importDictionaryFromFile( userInput[ 'characterDictionaryFileName' ], encoding=userInput[ 'characterDictionaryEncoding' ] )
-            if debug == True:
-                print( ( 'userInput[characterDictionary]=' + str( userInput[ 'characterDictionary' ] ) ).encode( consoleEncoding ) )
+            # characterDictionaryRegex lets parsingPrograms replace every name in a string in a single pass with: settings[ 'characterDictionaryRegex' ].sub( lambda match: characterDictionary[ match.group() ], myString )
+            userInput[ 'characterDictionary' ], userInput[ 'characterDictionaryRegex' ] = getCharacterDictionaryFromFile( userInput[ 'characterDictionaryFileName' ], userInput[ 'characterDictionaryEncoding' ] )
+            if debug:
+                printToConsole( 'userInput[characterDictionary]=' + str( userInput[ 'characterDictionary' ] ) )
 
         #elif functions.checkIfThisFileExists( userInput[ 'characterDictionaryFileName' ] ) != True:
         else:
             print( 'Warning: characterDictionary file was specified but does not exist:' )
-            print( ( userInput[ 'characterDictionaryFileName' ] ).encode(consoleEncoding) )
+            printToConsole( userInput[ 'characterDictionaryFileName' ] )
             userInput[ 'characterDictionaryFileName' ] = None
             userInput[ 'characterDictionary' ] = None
+            userInput[ 'characterDictionaryRegex' ] = None
 
     #elif userInput[ 'characterDictionaryFileName' ] == None
     else:
         userInput[ 'characterDictionary' ] = None
+        userInput[ 'characterDictionaryRegex' ] = None
 
     # This cannot be fully validated, checked to see if it exists, because the spreadsheet needs to be parsed first. So far, only the file name has been validated, so only setting a default value can be done at this point.
-    if userInput[ 'columnToUseForReplacements' ] == None:
+    if userInput[ 'columnToUseForReplacements' ] is None:
         userInput[ 'columnToUseForReplacements' ] = defaultOutputColumn
         userInput[ 'outputColumnIsDefault' ] = True
     else:
         userInput[ 'outputColumnIsDefault' ] = False
 
-    if userInput[ 'debug' ] == True:
+    if userInput[ 'debug' ]:
         userInput[ 'verbose' ] = True
+        verbose = True
         for key, value in userInput.items():
-            print( str( key ) + '=' + str( value ) )
+            printToConsole( str( key ) + '=' + str( value ) )
 
     # Handle encoding options here.
     # TODO: Update dealWithEncoding.ofThisFile() logic with to implement chardet library alternatives.
     #Syntax: def ofThisFile( myFileName, userInputForEncoding=None, fallbackEncoding=defaultTextFileEncoding ):
-    if pathlib.Path( userInput[ 'rawFileName'] ).suffix == '.ks':
+    if rawFileExtension == '.ks':
         # kirikiri .ks files have a different default of shift-jis.
         userInput[ 'rawFileEncoding' ] = dealWithEncoding.ofThisFile( userInput[ 'rawFileName'], userInput[ 'rawFileEncoding' ], defaultTextEncodingForKSFiles )
     else:
@@ -262,20 +384,17 @@ def validateUserInput( userInput ):
 
     userInput[ 'parseSettingsFileEncoding' ] = dealWithEncoding.ofThisFile( userInput[ 'parseSettingsFile'], userInput[ 'parseSettingsFileEncoding' ], defaultTextFileEncoding )
     userInput[ 'spreadsheetFileEncoding' ] = dealWithEncoding.ofThisFile( userInput[ 'spreadsheetFileName'], userInput[ 'spreadsheetFileEncoding' ], defaultTextFileEncoding )
-    if userInput[ 'translatedRawFileEncoding' ] == None:
+    if userInput[ 'translatedRawFileEncoding' ] is None:
         userInput[ 'translatedRawFileEncoding' ] = userInput[ 'rawFileEncoding' ]
 #    userInput[ 'translatedRawFileEncoding' ] = dealWithEncoding.ofThisFile( userInput[ 'translatedRawFileName'], userInput[ 'translatedRawFileEncoding' ], userInput[ 'rawFileEncoding' ] )
 
-    # Try to detect line endings from the original file so it can be used for output.
-    # dealWithEncoding.detectLineEndingsFromFile() returns a tuple like ( 'windows', '\r\n' ) or ( 'unix', '\n' ) .
-    detectedLineEndings = dealWithEncoding.detectLineEndingsFromFile( userInput[ 'rawFileName' ], userInput[ 'rawFileEncoding' ] )
-    print( 'detectedLineEndings=' + detectedLineEndings[0] )
-    userInput[ 'rawFileLineEndings' ] = detectedLineEndings[1]
-    #print( userInput[ 'rawFileLineEndings' ].encode( consoleEncoding ) )
+    # The line endings of rawFile are only needed for mode=output, so they are detected by getRawFileLineEndings() from processRawFile() only then.
 
-    if debug == True:
-        print( 'userInput[characterDictionary]=' + str( userInput[ 'characterDictionary' ] ) )
+    if debug:
+        printToConsole( 'userInput[characterDictionary]=' + str( userInput[ 'characterDictionary' ] ) )
 
+    # main() uses this to know it does not need to validate this dictionary again.
+    userInput[ 'validated' ] = True
     return userInput
 
 
@@ -283,69 +402,136 @@ def validateUserInput( userInput ):
 def getParseSettingsDictionary( parsingProgram, parseSettingsFile=None, parseSettingsFileEncoding=defaultTextFileEncoding ):
     parsingScriptObject = pathlib.Path( parsingProgram ).absolute()
 
-    if parseSettingsFile == None:
+    if parseSettingsFile is None:
         #check to see if settings file exists.
-        if functions.checkIfThisFileExists( str( parsingScriptObject.parent ) + '/' + parsingScriptObject.stem + parseSettingsExtension ) == True:
+        if functions.checkIfThisFileExists( str( parsingScriptObject.parent ) + '/' + parsingScriptObject.stem + parseSettingsExtension ):
             parseSettingsFile=str( parsingScriptObject.parent ) + '/' + parsingScriptObject.stem + parseSettingsExtension
-        elif functions.checkIfThisFileExists( str( parsingScriptObject ) + parseSettingsExtension ) == True:
+        elif functions.checkIfThisFileExists( str( parsingScriptObject ) + parseSettingsExtension ):
             parseSettingsFile = str( parsingScriptObject ) + parseSettingsExtension
 
     if debug==True:
-        print( 'iniName1=' + str( parsingScriptObject.parent ) + parsingScriptObject.stem + parseSettingsExtension)
-        print( 'iniName2=' + str( parsingScriptObject ) + parseSettingsExtension )
+        printToConsole( 'iniName1=' + str( parsingScriptObject.parent ) + parsingScriptObject.stem + parseSettingsExtension)
+        printToConsole( 'iniName2=' + str( parsingScriptObject ) + parseSettingsExtension )
 
-    if parseSettingsFile != None:
+    if parseSettingsFile is not None:
         print( 'Info: Using the following file as parseSettingsDictionary:' )
-        print( parseSettingsFile.encode( consoleEncoding ) )
+        printToConsole( parseSettingsFile )
     #elif parseSettingsFile == None:
     else:
         print( 'Info: parseSettingsDictionary was not found.')
         return None
 
-    parseSettingsDictionary = getDictionaryFromTextFile( parseSettingsFile, parseSettingsFileEncoding )
+    parseSettingsDictionary = getDictionaryFromParseSettingsFile( parseSettingsFile, parseSettingsFileEncoding )
 
     if debug==True:
-        print( ( 'parseSettingsDictionary=' + str( parseSettingsDictionary ) ).encode( consoleEncoding ) )
+        printToConsole( 'parseSettingsDictionary=' + str( parseSettingsDictionary ) )
 
     return parseSettingsDictionary
 
 
-def main( userInput=None ):
-    if not isinstance( userInput, dict ):
-        # Define command line options.
-        # userInput is a dictionary.
-        userInput = createCommandLineOptions()
-        # Verify input.
-        userInput = validateUserInput( userInput ) # This should also read in all of the input files into dictionaries except for the parseScript.py.
-
-    if debug == True:
-        print( ( 'userInput=' + str(userInput) ).encode(consoleEncoding) )
-
-    # Import algorithm: Create scratchpad directory, copy target script to scratchpad directory, import as: import scratchpad.temp as customParser
-    # This is ideal because: 
-    # 1. Weird file system names that are not valid module names are then no longer an issue.
-    # 2. Trying to resolve paths and importing above parent directory from __main__ is no longer an issue.
-    # 3. The importlib library to handle special import handling is no longer necessary. However, shutil.copy becomes necessary to copy the code. The alternative to shutil is platform specific code with the os module, or opening the file and copying the contents manually.
-    # 4. scratchpad is already labeled as a temporary directory in git.
-    # The best alternative is sys.path.append(/path/to/library.py) but there is no way of knowing if 'library' has forbidden characters for library names like -, so renaming would be necessary. However, that would alter the file name the user specified, so that is absolutely not allowed which makes copying the file to a temporary location unavoidable.
-
-    parsingScriptObject = pathlib.Path( userInput['parsingProgram'] ).resolve()
-    global tempParseScriptPathAndName
-    tempParseScriptPathAndName = str( pathlib.Path( __file__ ).resolve().parent ) + '/' + tempParseScriptPathAndName
-    #print( 'tempParseScriptPathAndName=' + tempParseScriptPathAndName )
-
-    pathlib.Path( tempParseScriptPathAndName ).resolve().parent.mkdir( parents = True, exist_ok = True )
-
-    if debug == True:
-        print( 'copyFrom=' + str( parsingScriptObject ) )
-        print( 'copyTo=' + str( pathlib.Path( tempParseScriptPathAndName ).resolve() ) )
-
-    # TODO: before copying, if the target exists, then read both files and compare their hash. Do not copy if their hashes match.
-    # Minor issue still: No way to avoid hardcoding this unless using the importlib module.
-    shutil.copy( str(parsingScriptObject) , tempParseScriptPathAndName )
-
-    sys.path.append( str( pathlib.Path(__file__).resolve().parent ) )
-    import scratchpad.temp as customParser          # Hardcoded to import as scratchpad\temp.py
+# This returns the line endings of rawFile, like '\r\n' or '\n', so they can be used for output. They are only detected the first time this is called for userInput.
+def getRawFileLineEndings( userInput ):
+    if userInput.get( 'rawFileLineEndings' ) is None:
+        # Try to detect line endings from the original file.
+        # dealWithEncoding.detectLineEndingsFromFile() returns a tuple like ( 'windows', '\r\n' ) or ( 'unix', '\n' ) .
+        detectedLineEndings = getLineEndingsFromFile( userInput[ 'rawFileName' ], userInput[ 'rawFileEncoding' ] )
+        # This is only diagnostic output, so do not build the message unless it will be shown.
+        if verbose:
+            print( 'detectedLineEndings=' + detectedLineEndings[0] )
+        userInput[ 'rawFileLineEndings' ] = detectedLineEndings[1]
+    return userInput[ 'rawFileLineEndings' ]
+
+
+# These functions write out the return value from customParser.output() to userInput[ 'translatedRawFileName' ]. They return True if they wrote the file or False otherwise.
+# chocolate.Strawberry() will print out its own confirmation of writing out the file on its own, so only the other ones print it.
+def writeStrawberryTranslatedTextFile( translatedTextFile, userInput ):
+    translatedTextFile.export( userInput[ 'translatedRawFileName' ], fileEncoding=userInput[ 'translatedRawFileEncoding' ] )
+    return True
+
+
+def writeStringTranslatedTextFile( translatedTextFile, userInput ):
+    # Get the line endings before opening the output file in case translatedRawFileName is the same file as rawFileName.
+    rawFileLineEndings = getRawFileLineEndings( userInput )
+    with open( userInput[ 'translatedRawFileName' ], 'w', encoding=userInput[ 'translatedRawFileEncoding' ], errors=outputErrorHandling, newline='', buffering=outputFileBufferSize ) as myFileHandle:
+        myFileHandle.write( translatedTextFile.replace( '\n', rawFileLineEndings ) )
+    printToConsole( 'Wrote: ' + userInput[ 'translatedRawFileName' ] )
+    return True
+
+
+def writeListTranslatedTextFile( translatedTextFile, userInput ):
+    # Get the line endings before opening the output file in case translatedRawFileName is the same file as rawFileName.
+    rawFileLineEndings = getRawFileLineEndings( userInput )
+    with open( userInput[ 'translatedRawFileName' ], 'w', encoding=userInput[ 'translatedRawFileEncoding' ], errors=outputErrorHandling, newline='', buffering=outputFileBufferSize ) as myFileHandle:
+        # This might corrupt the output on Linux/Unix or vica-versa on Windows if the software is expecting and requires a specific type of newline \r\n or \n.
+        # By default, Python will translate \n based upon the host OS, not what the software that will actually read the file is expecting because it cannot possibly know that, therefore this is a potential source of corruption.
+        # A sane way of handling this is to maybe determine the line ending of the original file and use that line ending schema here. How are line endings determined? Huristics? How does Python determine line endings correctly when the platform does not match the source file?
+        # Update: updated dealWithEncoding to also detect line endings for the input file. If the output is corrupt now, then so was the input. TODO: Check this actually works as intended.
+        # Joining the entries first means the whole file is encoded and written with one write() call instead of creating a new entry + line ending string for every entry.
+        # Every entry, including the last one, ends with a line ending, so an empty list writes an empty file.
+        if len( translatedTextFile ) != 0:
+            myFileHandle.write( rawFileLineEndings.join( translatedTextFile ) + rawFileLineEndings )
+    printToConsole( 'Wrote: ' + userInput[ 'translatedRawFileName' ] )
+    return True
+
+
+def writeEmptyTranslatedTextFile( translatedTextFile, userInput ):
+    print( 'Empty file.' )
+    return False
+
+
+# The exact type of translatedTextFile is used to look up the correct function, so a dictionary lookup is all that is needed for the normal cases.
+# chocolate.Strawberry is added by importChocolate().
+translatedTextFileWriters = {
+str : writeStringTranslatedTextFile,
+list : writeListTranslatedTextFile,
+type( None ) : writeEmptyTranslatedTextFile,
+}
+
+
+def writeUnknownTypeOfTranslatedTextFile( translatedTextFile, userInput ):
+    # Subclasses of the supported types do not match their exact type, so check for them here before giving up.
+    for supportedType, writeTranslatedTextFile in translatedTextFileWriters.items():
+        if isinstance( translatedTextFile, supportedType ):
+            return writeTranslatedTextFile( translatedTextFile, userInput )
+
+    print( 'Error: Unknown type of return value from parsing script. Must be a chocolate.Strawberry(), list, or string.' )
+    print( 'type=' +  str( type( translatedTextFile ) ) )
+    return False
+
+
+# chocolate imports openpyxl which takes a while, so only import it once it is actually needed. That way, --help, --version, and invalid input exit quickly.
+def importChocolate():
+    global chocolate
+    import resources.chocolate as chocolate
+    translatedTextFileWriters[ chocolate.Strawberry ] = writeStrawberryTranslatedTextFile
+
+
+# This imports parsingProgram directly from the path the user specified and returns the imported module.
+# Import algorithm: Use importlib to load the file at that path as a module named customParser.
+# This is ideal because:
+# 1. Weird file system names that are not valid module names, like names with - and . in them, are not an issue since the module name does not come from the file name.
+# 2. Trying to resolve paths and importing above parent directory from __main__ is not an issue since the full path is used.
+# 3. Nothing needs to be copied to a temporary location first, so there is no scratchpad\temp.py that could be out of date or be overwritten by another instance of this program.
+# parsingProgram is executed again every time this is called, so editing it between calls to main() in library mode works as expected.
+def importParsingProgram( parsingProgram ):
+    importChocolate()
+
+    # parsingPrograms import the libraries in resources as resources.chocolate, resources.functions, and so on, so the directory this script is in must be importable.
+    if scriptDirectory not in sys.path:
+        sys.path.append( scriptDirectory )
+
+    parsingScriptObject = pathlib.Path( parsingProgram ).resolve()
+    if debug:
+        printToConsole( 'importFrom=' + str( parsingScriptObject ) )
+
+    moduleSpecification = importlib.util.spec_from_file_location( 'customParser', str( parsingScriptObject ) )
+    if moduleSpecification is None:
+        printToConsole( 'Error: Unable to import parsingProgram as a Python module: ' + str( parsingScriptObject ) )
+        sys.exit( 1 )
+    customParser = importlib.util.module_from_spec( moduleSpecification )
+    # Some libraries, like dataclasses and pickle, expect the module to be listed in sys.modules while it is being executed.
+    sys.modules[ 'customParser' ] = customParser
+    moduleSpecification.loader.exec_module( customParser )
 
     # TODO: Now that customParser exists, the internal variable names can be updated.
     # Update debug setting in all imported libraries, chocolate, functions, dealWithEncoding, and the parsingProgram.
@@ -353,30 +539,40 @@ def main( userInput=None ):
     #customParser.verbose=...
     #customParser.debug=...
 
-    parseSettingsDictionary = getParseSettingsDictionary( userInput['parsingProgram'], parseSettingsFile=userInput[ 'parseSettingsFile' ], parseSettingsFileEncoding=userInput[ 'parseSettingsFileEncoding' ] )
+    return customParser
+
+
+# This processes a single rawFile by calling customParser.input() or customParser.output() depending upon the mode. userInput must already be validated.
+# For mode=output, this returns True if the translated file was written or False otherwise, so callers do not need to check the file system to find out.
+def processRawFile( userInput, customParser, parseSettingsDictionary ):
+    # Parsing programs can read settings[ 'rawFileLineEndings' ] in output(), so detect them before building settings. mode=input does not need them, so it skips reading rawFile for them.
+    if userInput[ 'mode' ] == 'output':
+        getRawFileLineEndings( userInput )
 
     # Just dump everything into a 'settings' dictionary {} so the API does not have to change as often, to present a uniform API over all the parsers, and improve user experience.
-    settings = userInput.copy()
-    settings[ 'fileEncoding' ] = userInput[ 'rawFileEncoding' ]
-    settings[ 'parseSettingsDictionary' ] = parseSettingsDictionary
-    settings[ 'outputColumn'] = userInput[ 'columnToUseForReplacements' ]
-    #settings[ 'rawFileLineEndings' ] = userInput[ 'rawFileLineEndings' ] 
+    # The keys after **userInput are either new or deliberately replace the ones from userInput.
+    settings = {
+        **userInput,
+        'fileEncoding' : userInput[ 'rawFileEncoding' ],
+        'parseSettingsDictionary' : parseSettingsDictionary,
+        'outputColumn' : userInput[ 'columnToUseForReplacements' ],
+        }
 
     if userInput[ 'mode' ] == 'input':
         # def input( fileNameWithPath, characterDictionary=None, settings={} ):
         mySpreadsheet = customParser.input( userInput['rawFileName'], characterDictionary=userInput[ 'characterDictionary' ], settings=settings )
  
-        if mySpreadsheet == None:
+        if mySpreadsheet is None:
             print( 'Empty file.' )
             sys.exit( 1 )
         else:
             assert( isinstance( mySpreadsheet, chocolate.Strawberry )  )
 
-        if debug == True:
+        if debug:
             mySpreadsheet.printAllTheThings()
 
         # Export to .xlsx
-        if userInput[ 'testRun' ] != True:
+        if not userInput[ 'testRun' ]:
             # Writing operations are always scary, so mySpreadsheet.export() should always print when it is writing output internally. No need to do it again here.
             mySpreadsheet.export( userInput[ 'spreadsheetFileName' ], fileEncoding=userInput[ 'spreadsheetFileEncoding' ] )
 
@@ -387,40 +583,125 @@ def main( userInput=None ):
         #def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings={} ): # mySpreadsheet is a chocolate Strawberry.
         translatedTextFile = customParser.output( userInput['rawFileName'], mySpreadsheet=mySpreadsheet, characterDictionary=userInput[ 'characterDictionary' ], settings=settings )
 
-        if debug == True:
-            print( ( 'translatedTextFile=' + str(translatedTextFile) ).encode( consoleEncoding ) )
-
-        if userInput[ 'testRun' ] == True:
-            return
-
-        wroteFile = False
-        if isinstance( translatedTextFile, chocolate.Strawberry) == True:
-            translatedTextFile.export( userInput[ 'translatedRawFileName' ], fileEncoding=userInput[ 'translatedRawFileEncoding' ] )
-            wroteFile = True
-        elif isinstance( translatedTextFile, str ) == True:
-            #userInput exists
-            with open( userInput[ 'translatedRawFileName' ], 'w', encoding=userInput[ 'translatedRawFileEncoding' ], errors=outputErrorHandling, newline='' ) as myFileHandle:
-                myFileHandle.write( translatedTextFile.replace( '\n', userInput[ 'rawFileLineEndings' ] ) )
-            wroteFile = True
-        elif isinstance( translatedTextFile, list ) == True:
-            with open( userInput[ 'translatedRawFileName' ], 'w', encoding=userInput[ 'translatedRawFileEncoding' ], errors=outputErrorHandling, newline='' ) as myFileHandle:
-                for entry in translatedTextFile:
-                    # This might corrupt the output on Linux/Unix or vica-versa on Windows if the software is expecting and requires a specific type of newline \r\n or \n.
-                    # By default, Python will translate \n based upon the host OS, not what the software that will actually read the file is expecting because it cannot possibly know that, therefore this is a potential source of corruption.
-                    # A sane way of handling this is to maybe determine the line ending of the original file and use that line ending schema here. How are line endings determined? Huristics? How does Python determine line endings correctly when the platform does not match the source file?
-                    # Update: updated dealWithEncoding to also detect line endings for the input file. If the output is corrupt now, then so was the input. TODO: Check this actually works as intended.
-                    myFileHandle.write( entry + userInput[ 'rawFileLineEndings' ] )
-            wroteFile = True
-        elif translatedTextFile == None:
-            print( 'Empty file.' )
-        else:
-            print( 'Error: Unknown type of return value from parsing script. Must be a chocolate.Strawberry(), list, or string.' )
-            print( 'type=' +  str( type( translatedTextFile ) ) )
+        if debug:
+            printToConsole( 'translatedTextFile=' + str(translatedTextFile) )
+
+        if userInput[ 'testRun' ]:
+            return False
+
+        # Pick the function that writes out translatedTextFile based upon the type the parsing script returned.
+        writeTranslatedTextFile = translatedTextFileWriters.get( type( translatedTextFile ), writeUnknownTypeOfTranslatedTextFile )
+        return writeTranslatedTextFile( translatedTextFile, userInput )
+
+
+# This returns a list of every rawFile listed in batchFileName, one per line. Empty lines and lines that start with # are ignored.
+def getRawFileNamesFromBatchFile( batchFileName, batchFileEncoding=defaultTextFileEncoding ):
+    functions.verifyThisFileExists( batchFileName, batchFileName )
+    with open( batchFileName, 'rt', encoding=batchFileEncoding, errors=inputErrorHandling ) as myFileHandle:
+        inputFileContents = myFileHandle.read().splitlines()
+
+    rawFileNames = []
+    for myLine in inputFileContents:
+        myLine = myLine.strip()
+        if ( myLine == '' ) or myLine.startswith( '#' ):
+            continue
+        rawFileNames.append( myLine )
+    return rawFileNames
+
+
+# In batch mode, every process keeps its own customParser and parseSettingsDictionary and reuses them for every rawFile that process handles.
+batchCustomParser = None
+batchParseSettingsDictionary = None
+# The parsingProgram, parseSettingsFile, and characterDictionary are the same for every rawFile, so only check if they exist once per process.
+batchFileStatusCache = {}
+
+# This validates and processes a single rawFile in batch mode.
+def processBatchRawFile( rawFileUserInput ):
+    global batchCustomParser
+    global batchParseSettingsDictionary
+
+    printToConsole( 'Info: Processing: ' + rawFileUserInput[ 'rawFileName' ] )
+    rawFileUserInput = validateUserInput( rawFileUserInput, fileStatusCache=batchFileStatusCache )
+
+    if batchCustomParser is None:
+        batchCustomParser = importParsingProgram( rawFileUserInput[ 'parsingProgram' ] )
+        batchParseSettingsDictionary = getParseSettingsDictionary( rawFileUserInput[ 'parsingProgram' ], parseSettingsFile=rawFileUserInput[ 'parseSettingsFile' ], parseSettingsFileEncoding=rawFileUserInput[ 'parseSettingsFileEncoding' ] )
+
+    # Every rawFile gets its own copy, so changes the parsingProgram makes to it while processing one file do not carry over to the next one.
+    processRawFile( rawFileUserInput, batchCustomParser, copy.deepcopy( batchParseSettingsDictionary ) )
+    # mode=input may have just created the spreadsheet, so forget about it in case another entry in the batch file uses the same one.
+    batchFileStatusCache.pop( rawFileUserInput[ 'spreadsheetFileName' ], None )
+
+
+# Batch mode processes every rawFile listed in the batch file using the same parsingProgram. The parsingProgram and its settings file are only loaded once per process.
+# If more than one job was requested, then the files are split between that many processes since every rawFile can be processed independently.
+def processBatchFile( userInput ):
+    if userInput[ 'rawFileName' ] is not None:
+        print( 'Error: Please specify either rawFile or --batch, not both.' )
+        sys.exit( 1 )
+    # Every rawFile needs its own spreadsheet and translatedRawFile, so only the default names make sense in batch mode.
+    if ( userInput[ 'spreadsheetFileName' ] is not None ) or ( userInput[ 'translatedRawFileName' ] is not None ):
+        print( 'Error: --spreadsheet and --translatedRawFile cannot be used with --batch. The default names will be used for every file instead.' )
+        sys.exit( 1 )
+
+    # Dictionaries passed to main() from other programs might not have the batch specific options, so use the same defaults as the CLI.
+    batchFileEncoding = dealWithEncoding.ofThisFile( userInput[ 'batchFileName' ], userInput.get( 'batchFileEncoding' ), defaultTextFileEncoding )
+    rawFileNames = getRawFileNamesFromBatchFile( userInput[ 'batchFileName' ], batchFileEncoding )
+    if len( rawFileNames ) == 0:
+        printToConsole( 'Error: No files were listed in batch file: ' + userInput[ 'batchFileName' ] )
+        sys.exit( 1 )
+
+    # validateUserInput() changes the dictionary it was given, so every rawFile needs its own copy.
+    listOfRawFileUserInput = []
+    for rawFileName in rawFileNames:
+        rawFileUserInput = userInput.copy()
+        rawFileUserInput[ 'rawFileName' ] = rawFileName
+        listOfRawFileUserInput.append( rawFileUserInput )
+
+    # Check this only once here instead of letting every process below fail on its own.
+    functions.verifyThisFileExists( userInput[ 'parsingProgram' ], userInput[ 'parsingProgram' ] )
+
+    numberOfJobs = userInput.get( 'numberOfJobs', 1 )
+    if numberOfJobs < 1:
+        numberOfJobs = os.cpu_count()
+    numberOfJobs = min( numberOfJobs, len( listOfRawFileUserInput ) )
+
+    if numberOfJobs == 1:
+        for rawFileUserInput in listOfRawFileUserInput:
+            processBatchRawFile( rawFileUserInput )
+        return
+
+    import concurrent.futures
+    print( 'Info: Processing ' + str( len( listOfRawFileUserInput ) ) + ' files using ' + str( numberOfJobs ) + ' processes.' )
+    with concurrent.futures.ProcessPoolExecutor( max_workers=numberOfJobs ) as executor:
+        # Going through the results re-raises any errors, including sys.exit(), from the processes here.
+        for result in executor.map( processBatchRawFile, listOfRawFileUserInput ):
+            pass
+
+
+def main( userInput=None ):
+    if not isinstance( userInput, dict ):
+        # Define command line options.
+        # userInput is a dictionary.
+        userInput = createCommandLineOptions()
+
+    # Batch mode works the same way for the CLI and for dictionaries passed in directly. Dictionaries that validateUserInput() already returned are for a single rawFile, even if they came from a batch.
+    if ( userInput.get( 'batchFileName' ) is not None ) and ( not userInput.get( 'validated' ) ):
+        processBatchFile( userInput )
+        return
+
+    # Verify input. Dictionaries that already went through validateUserInput() do not need to be checked again.
+    if not userInput.get( 'validated' ):
+        userInput = validateUserInput( userInput ) # This should also read in all of the input files into dictionaries except for the parseScript.py.
+
+    if debug:
+        printToConsole( 'userInput=' + str(userInput) )
+
+    customParser = importParsingProgram( userInput[ 'parsingProgram' ] )
+
+    parseSettingsDictionary = getParseSettingsDictionary( userInput['parsingProgram'], parseSettingsFile=userInput[ 'parseSettingsFile' ], parseSettingsFileEncoding=userInput[ 'parseSettingsFileEncoding' ] )
 
-        if wroteFile == True:
-            # chocolate.Strawberry() will print out its own confirmation of writing out the file on its own, so do not duplicate that message here.
-            if ( functions.checkIfThisFileExists( userInput[ 'translatedRawFileName' ] ) == True ) and ( isinstance( translatedTextFile, chocolate.Strawberry ) == False ):
-                print( ( 'Wrote: ' + userInput[ 'translatedRawFileName' ] ).encode( consoleEncoding ) )
+    return processRawFile( userInput, customParser, parseSettingsDictionary )
 
 
 if __name__ == '__main__':
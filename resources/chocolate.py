@@ -17,6 +17,7 @@ debug = False
 consoleEncoding = 'utf-8'
 defaultTextFileEncoding = 'utf-8'   # Settings that should not be left as a default setting should have default prepended to them.
 inputErrorHandling = 'strict'
+outputFileBufferSize = 1048576    # Size in bytes of the write buffer for .csv files. Larger buffers mean fewer writes to disk.
 #outputErrorHandling = 'namereplace'  #This is set dynamically below.
 
 #These must be here or the library will crash even if these modules have already been imported by main program.
@@ -26,38 +27,68 @@ import sys                                   # End program on fail condition.
 #import random                             # Used to create random numbers. 
 import openpyxl                          # Used as the core internal data structure and also to read/write xlsx files.
 import csv                                   # Read and write to csv files. Example: Read in 'resources/languageCodes.csv'
-try:
-    import xlrd                              #Provides reading from Microsoft Excel Document (.xls).
-    xlrdLibraryIsAvailable = True
-except:
-    xlrdLibraryIsAvailable = False
-try:
-    import xlwt                              #Provides writing to Microsoft Excel Document (.xls).
-    xlwtLibraryIsAvailable = True
-except:
-    xlwtLibraryIsAvailable = False
-try:
-    import odfpy                           #Provides interoperability for Open Document Spreadsheet (.ods). Alternatives: https://github.com/renoyuan/easyofd pyexcel-ods3, pyexcel-ods, ezodf
-    odfpyLibraryIsAvailable = True
-except:
-    odfpyLibraryIsAvailable = False
+import importlib.util                    # Check if the optional libraries are installed without importing them.
+# The optional libraries are only needed for .xls and .ods files, so only check if they are installed here. Import them inside the functions that actually use them.
+xlrdLibraryIsAvailable = ( importlib.util.find_spec( 'xlrd' ) != None )        #Provides reading from Microsoft Excel Document (.xls).
+xlwtLibraryIsAvailable = ( importlib.util.find_spec( 'xlwt' ) != None )        #Provides writing to Microsoft Excel Document (.xls).
+# The odfpy package installs itself as 'odf'.
+odfpyLibraryIsAvailable = ( importlib.util.find_spec( 'odf' ) != None )       #Provides interoperability for Open Document Spreadsheet (.ods). Alternatives: https://github.com/renoyuan/easyofd pyexcel-ods3, pyexcel-ods, ezodf
+
+# importFromCSV() changes entries that match these, ignoring case, into the Python values instead of leaving them as strings.
+csvValuesToConvert={ 'true':True, 'false':False, 'none':None, '':None }
+csvMaxLengthOfValueToConvert=max( len(i) for i in csvValuesToConvert )
 
 #Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling = 'namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling = 'backslashreplace'
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
+
+# This prints message to the console as text instead of the b'' representation of print( message.encode( consoleEncoding ) ), so the messages match the ones from py3AnyText2Spreadsheet.py.
+# Characters the console cannot display are replaced using outputErrorHandling instead of crashing the program.
+def printToConsole( message ):
+    try:
+        print( message )
+    except UnicodeEncodeError:
+        stdoutEncoding = getattr( sys.stdout, 'encoding', None ) or consoleEncoding
+        print( message.encode( stdoutEncoding, errors=outputErrorHandling ).decode( stdoutEncoding ) )
+
+
+# This returns the number of lines in a .csv file without parsing it, which is useful for progress reporting before calling importFromCSV().
+# Entries that are quoted and have new lines inside of them are counted as more than one line, so this is the maximum number of rows the file could have.
+# This only works for encodings where \n is the single byte 0x0A, like utf-8 and shift-jis, not utf-16.
+# The file is read as binary in large chunks and bytes.count() does the counting in C. mmap would also work, but it fails on empty files and mmap objects do not have count().
+def countCSVRows( fileNameWithPath, chunkSize=1048576 ):
+    totalLines=0
+    lastCharacter=b'\n'
+    with open( fileNameWithPath, 'rb' ) as myFileHandle:
+        while True:
+            chunk=myFileHandle.read( chunkSize )
+            if len( chunk ) == 0:
+                break
+            totalLines+=chunk.count( b'\n' )
+            lastCharacter=chunk[ -1: ]
+    # The last line does not always end with a new line.
+    if lastCharacter != b'\n':
+        totalLines+=1
+    return totalLines
 
 
 #wrapper class for spreadsheet data structure
 class Strawberry:
     # self is not a keyword. It can be anything, like pie, but it must be the first argument for every function in the class. 
     # Quirk: It can be different string/word for each method and they all still refer to the same object.
-    def __init__(self, myFileName=None, fileEncoding=defaultTextFileEncoding, removeWhitespaceForCSV=False, addHeaderToTextFile=False, spreadsheetNameInWorkbook=None, readOnlyMode=False, csvDialect=None):
+    def __init__(self, myFileName=None, fileEncoding=defaultTextFileEncoding, removeWhitespaceForCSV=False, addHeaderToTextFile=False, spreadsheetNameInWorkbook=None, readOnlyMode=False, csvDialect=None, writeOnly=False):
         # https://openpyxl.readthedocs.io/en/stable/api/openpyxl.workbook.workbook.html
         self.fileEncoding=fileEncoding
-        self.workbook = openpyxl.Workbook()
-        if spreadsheetNameInWorkbook == None:
+        # writeOnly == True uses openpyxl's write_only mode which streams rows out to a temporary file as they are appended instead of keeping every cell in memory.
+        # That is useful for very large spreadsheets that only need to be created and then exported as .xlsx.
+        # However, then only appendRow() and export() to .xlsx, once, will work. Anything that needs to read the data back, like getRow(), getColumn(), the search functions, replaceRow(), and exporting to .csv, will not.
+        # https://openpyxl.readthedocs.io/en/stable/optimized.html
+        self.writeOnly=writeOnly
+        self.workbook = openpyxl.Workbook( write_only=writeOnly )
+        if writeOnly == True:
+            # write_only workbooks start without any spreadsheets, so always create one.
+            self.spreadsheet = self.workbook.create_sheet( title = spreadsheetNameInWorkbook )
+            self.spreadsheetName=self.spreadsheet.title
+        elif spreadsheetNameInWorkbook == None:
             self.spreadsheet = self.workbook.active
             self.spreadsheetName=self.spreadsheet.title
         else:
@@ -68,6 +99,9 @@ class Strawberry:
             self.spreadsheet = self.workbook[ self.spreadsheetName ]
         self.readOnlyMode = readOnlyMode
         self.csvDialect=csvDialect
+        # This is a dictionary of { headerValue : columnLetter } that searchHeaders() builds the first time it is called. It is set back to None whenever the headers might have changed.
+        # Any code that changes the first row of self.spreadsheet directly, instead of by using the methods here, should also set this back to None.
+        self._headersIndex=None
         self.addHeaderToTextFile=addHeaderToTextFile
         #self.randomNumber=int( random.random() * 500000 )
 
@@ -114,7 +148,7 @@ class Strawberry:
                 else:
                     #Else the file must be a text file to instantiate a class with. Only line-by-line parsing is supported.
                     if ( myFileExtensionOnly != '.txt' ) and ( myFileExtensionOnly != '.text' ):
-                        print( ('Warning: Attempting to instantiate chocolate.Strawberry() using file with unknown extension:\'' + myFileExtensionOnly + '\' Reading in line-by-line. This is probably incorrect. Reference:\'' + myFileName + '\'').encode(consoleEncoding))
+                        printToConsole( 'Warning: Attempting to instantiate chocolate.Strawberry() using file with unknown extension:\'' + myFileExtensionOnly + '\' Reading in line-by-line. This is probably incorrect. Reference:\'' + myFileName + '\'' )
                     self.importFromTextFile( myFileName, fileEncoding,addHeaderToTextFile=self.addHeaderToTextFile)
 
 
@@ -126,6 +160,8 @@ class Strawberry:
 
 
     # Expects a Python list.
+    # This does not need to reset self._headersIndex. searchHeaders() only stores the index once row 1 has cells, and append() always adds rows after the last row that has cells, so it can never change row 1 once the index exists.
+    # On an empty spreadsheet, there is no index yet, so the first row appended becomes row 1 and is read by the next searchHeaders().
     def appendRow( self, newRow ):
         self.spreadsheet.append( newRow )
 
@@ -135,6 +171,7 @@ class Strawberry:
 
     # This sets the value of the cell based upon the cellAddress in the form of 'A4'.
     def setCellValue( self, cellAddress, value ):
+        self._headersIndex=None
         self.spreadsheet[cellAddress]=value
 
 
@@ -143,49 +180,23 @@ class Strawberry:
         return self.spreadsheet[cellAddress].value
 
 
-    # Full name of this function is _getCellAddressFromRawCellString, but was shortened for legibility. Edit: Made it longer again.
-    # This functions would return 'B5' from: <Cell 'Sheet'.B5>
-#    def _getCellAddressFromRawCellString( self, myInputCellRaw ):
-        #print('raw cell data='+str(myInputCellRaw))
-        #myInputCellRaw=str(myInputCellRaw)
-        #Basically, split the string according to . and then split it again according to > to get back only the CellAddress
-#        return str(myInputCellRaw).split('.', maxsplit=1)[1].split('>')[0]
-        #return [currentRow, currentColumn
-
-
     # This function returns a tuple containing 2 strings that represent a row and column extracted from input Cell address
-    # such as returning ['5', 'B'] from: <Cell 'Sheet'.B5>   It also works for complicated cases like AB534.
+    # such as returning ('5', 'B') from: <Cell 'Sheet'.B5>   It also works for complicated cases like AB534.
+    # Internally, the search functions just use cell.row and cell.column_letter now. This is kept for any code that still calls it.
+    # To get the address as a single string like 'B5', use cell.coordinate instead.
     def _getRowAndColumnFromRawCellString( self, myInputCellRaw ):
-        #print('raw cell data='+str(myInputCellRaw))
+        # openpyxl Cell objects already know their own row and column, so there is no need to parse the address out of str(cell).
+        # https://openpyxl.readthedocs.io/en/stable/api/openpyxl.cell.cell.html
+        if not isinstance( myInputCellRaw, str ):
+            return ( str(myInputCellRaw.row), myInputCellRaw.column_letter )
+
         #basically, split the string according to . and then split it again according to > to get back only the CellAddress
-        myInputCell=str(myInputCellRaw).split('.', maxsplit=1)[1].split('>')[0]
-        #myInputCell=self._getCellAddressFromRawCellString(myInputCellRaw)
- 
-       # https://openpyxl.readthedocs.io/en/stable/api/openpyxl.utils.cell.html
-        # So apparently, there is a proper way to do this as openpyxl.utils.cell.coordinate_from_string('AB25') -> ('AB',25).
+        myInputCell=myInputCellRaw.split('.', maxsplit=1)[1].split('>')[0]
+        # https://openpyxl.readthedocs.io/en/stable/api/openpyxl.utils.cell.html
+        # openpyxl.utils.cell.coordinate_from_string('AB25') -> ('AB',25).
         column,row=openpyxl.utils.cell.coordinate_from_string( myInputCell )
-        # Swap order. Maybe this should be swapped back? Humm.
         return ( str(row), column )
 
-        # Old code:
-        index=0
-        for i in range(10): #Magic number.
-            try:
-                int(myInputCell[index:index+1])
-                index=i
-                break # This break and the assignment above will only execute when the int conversion works.
-            except:
-                # This will execute if there is an error, like int('A').
-                # This will not execute if the int conversion succeds.
-                #print('index='+str(index))
-                pass
-            index+=1
-        #currentColumn=myInputCell[:index] # Does not include character in string[Index] because index is after the :
-        #currentRow=myInputCell[index:] # Includes character specified by string[index] because index is before the :
-        #return [currentRow, currentColumn]
-        # Same as above, but faster.
-        return [myInputCell[index:], myInputCell[:index]]
-
     #Example:
     #myRawCell=''
     #for row in mySpreadsheet:
@@ -206,20 +217,15 @@ class Strawberry:
         if isinstance( rowNumber, str) == True:
             rowNumber=int(rowNumber)
 
-        myList=[]
-        for cell in self.spreadsheet[rowNumber]:
-            if debug == True:
-                #print( (str(self.spreadsheet[self._getCellAddressFromRawCellString(cell)].value)+',').encode(consoleEncoding),end='')
-                print( ( str(cell.value) + ',').encode(consoleEncoding), end='')
-            #myList.append(self.spreadsheet[self._getCellAddressFromRawCellString(cell)].value)
-            myList.append( cell.value )
+        myList=[ cell.value for cell in self.spreadsheet[rowNumber] ]
 
         #lengthOfHeader=len( self.spreadsheet[1] )
         #assert( len(myList) == lengthOfHeader )
-        assert( len(myList) == len(self.spreadsheet[1]) )
+        # max_column is the length of every row, including the header, so there is no need to build all of the Cell objects in the header again just to count them.
+        assert( len(myList) == self.spreadsheet.max_column )
 
-        if debug == True:
-            print('')
+        if debug:
+            printToConsole( str(myList) )
         return myList
 
 
@@ -232,27 +238,15 @@ class Strawberry:
             # Convert an integer to a column letter (3 -> 'C') so that the calling code does not have to care.
             columnLetter = openpyxl.utils.cell.get_column_letter(columnLetter)
 
-        myList=[]
         # Update: Would the built in iterators also work here? #Yes, but then how does the iterator/code know not to process undesired columns? Would have to process every column until the right one is found. 
-        for cell in self.spreadsheet[columnLetter]:
-            #print(str(mySpreadsheet[self._getCellAddressFromRawCellString(cell)].value)+',',end='')
-            #myList[i]=mySpreadsheet[self._getCellAddressFromRawCellString(cell)].value  #Doesn't work due to out of index error. Use append() method.
-            #myList.append( self.spreadsheet[self._getCellAddressFromRawCellString(cell)].value )
-            # v4.
-            myList.append( cell.value )
-
-        # Attempt 2.
-#        for column in self.spreadsheet.iter_cols():
-#            for cell in column:
-#                if cell.value == searchTerm:
-#                    return self._getRowAndColumnFromRawCellString(cell)[0]
-#            break
+        # v5.
+        myList=[ cell.value for cell in self.spreadsheet[columnLetter] ]
 
         try:
-            assert( len(myList) == len(self.spreadsheet['A']) )
+            assert( len(myList) == self.spreadsheet.max_row )
         except:
             print('len(myList)', len(myList))
-            print('len(self.spreadsheet[A])', len(self.spreadsheet['A']))
+            print('self.spreadsheet.max_row', self.spreadsheet.max_row)
             print('columnLetter=',columnLetter)
             print('type(columnLetter)=',type(columnLetter))
             raise
@@ -266,21 +260,23 @@ class Strawberry:
         #mySpreadsheet.append(newRow)
     # The rowLocation specified is the nth rowLocation, not the [0,1,2,3...] row number because rows start with 1.
     def replaceRow( self, rowLocation, newRowList ):
-        if debug == True:
-            print( str(len(newRowList) ).encode(consoleEncoding))
-            print( str(range(len(newRowList)) ).encode(consoleEncoding))
-            print( ('newRowList=' + str(newRowList) ).encode(consoleEncoding) )
-
-        for i in range(len(newRowList)):
-            #Syntax for assignment is: mySpreadsheet['A4'] = 'pie'
-            #mySpreadsheet['A4'] without an assignment returns: <Cell 'Sheet'.A4> 
-            #columns begin with 1 instead of 0, so add 1 when referencing the target column, but not the source because source is a python list which are referenced as list[0], list[1], list[2], list[3], etc
-
-            #Was workaround for Syntax error cannot assign value to function call: mySpreadsheet.cell(row=5, column=3)='pies'  
-            #spreadsheet[_getCellAddressFromRawCellString(spreadsheet.cell(row=int(rowLocation), column=i+1))]=newRowList[i]
-
-            #A more direct way of doing the same thing is to use .value without () on the cell after the cell reference.
-            self.spreadsheet.cell( row=int(rowLocation), column=i+1 ).value=newRowList[i]
+        if debug:
+            printToConsole( str(len(newRowList) ) )
+            printToConsole( str(range(len(newRowList)) ) )
+            printToConsole( 'newRowList=' + str(newRowList) )
+
+        rowLocation=int(rowLocation)
+        if rowLocation == 1:
+            self._headersIndex=None
+
+        # Do not check if rowLocation == self.spreadsheet.max_row + 1 in order to use append() instead. openpyxl recalculates max_row from every cell in the spreadsheet each time it is read, so checking would cost more than it would save.
+        getCell=self.spreadsheet.cell
+        #Syntax for assignment is: mySpreadsheet['A4'] = 'pie'
+        #mySpreadsheet['A4'] without an assignment returns: <Cell 'Sheet'.A4> 
+        #columns begin with 1 instead of 0, so start counting at 1 for the target column. The source is a python list which are referenced as list[0], list[1], list[2], list[3], etc
+        #A more direct way of doing the same thing is to use .value without () on the cell after the cell reference.
+        for columnNumber,value in enumerate( newRowList, start=1 ):
+            getCell( row=rowLocation, column=columnNumber ).value=value
         #return myWorkbook
 
     #Example: replaceRow(7,newRow)
@@ -302,47 +298,45 @@ class Strawberry:
             # This needs to be an int. Crash if it is not.
             tempColumnNumber=int( columnLetter )
 
-        if debug == True:
-            print( ( 'Replacing column \'' + columnLetter + '\' with the following contents:' ).encode(consoleEncoding) )
-            print( str( newColumnInAList ).encode(consoleEncoding) )
+        if debug:
+            printToConsole( 'Replacing column \'' + columnLetter + '\' with the following contents:' )
+            printToConsole( str( newColumnInAList ) )
+
+        self._headersIndex=None
 
-        for i in range( len(newColumnInAList) ):
-            #Syntax for assignment is: mySpreadsheet['A4'] = 'pie''
-            #Rows begin with 1, not 0, so add 1 to the reference row, but not to source list since list starts references at 0.
-            self.spreadsheet.cell( row=int( i+1 ), column=tempColumnNumber ).value=newColumnInAList[ i ]
+        # The column number is worked out once above, so the loop only has to look up each cell.
+        # Do not use self.spreadsheet.cell( row=, column=, value=value ) here because openpyxl ignores value=None that way, and then old data would not be cleared.
+        getCell=self.spreadsheet.cell
+        #Rows begin with 1, not 0, so start counting at 1 for the reference row.
+        for rowNumber,value in enumerate( newColumnInAList, start=1 ):
+            getCell( row=rowNumber, column=tempColumnNumber ).value=value
 
     #Example: replaceColumn('B',newColumnList)
 
 
+    # This returns True if nothing was ever written to the spreadsheet. iter_rows() without any limits yields nothing in that case instead of creating cell A1 like most other ways of reading cells do.
+    def _isEmpty( self ):
+        return next( self.spreadsheet.iter_rows(), None ) == None
+
+
     # Return either None if there is no cell with the search term, or the column letter of the cell if it found it. Case and whitespace sensitive search.
-    # Aside: To determine the row, the column, or both from the raw cell address, call self._getRowAndColumnFromRawCellString(rawCellAddress)
+    # Aside: To determine the row, the column, or both from a cell, use cell.row, cell.column_letter, or cell.coordinate
+    # The first row is only read once and the result is stored in self._headersIndex, so looking up many headers is fast.
+    # iter_rows() without max_row yields nothing for a spreadsheet that was never written to, so searching an empty spreadsheet does not create cell A1. Nothing is stored in that case, so headers appended later are still found.
     def searchHeaders( self, searchTerm ):
-        for row in self.spreadsheet.iter_rows():
-            for cell in row:
-                if cell.value == searchTerm:
-                    return self._getRowAndColumnFromRawCellString(cell)[1]
-            break
-        return None
-
-        # Old code.
-        cellFound=None
-        for row in self.spreadsheet[1]:
-            for i in row:
-                if i.value == searchTerm:
-                    cellFound=i
-                    break
-            #if cellFound != None:
-            #    print('found')
-            #else:
-            #    print('notfound')
-            break #stop searching after first row  #Hummmmmm.
-        if cellFound == None:
-            return None
-        #Slower.
-        #else:
-            #myRowNumber, myColumnLetter = self._getRowAndColumnFromRawCellString(cellFound)
-        #return myColumnLetter
-        return self._getRowAndColumnFromRawCellString(cellFound)[1]   #Faster.
+        if self._headersIndex == None:
+            headersIndex={}
+            for row in self.spreadsheet.iter_rows():
+                for cell in row:
+                    # If there are duplicate headers, then keep the first one, the left-most, like a normal search would.
+                    if cell.value not in headersIndex:
+                        headersIndex[ cell.value ]=cell.column_letter
+                # Only the first row has headers.
+                break
+            if len( headersIndex ) == 0:
+                return None
+            self._headersIndex=headersIndex
+        return self._headersIndex.get( searchTerm )
 
     #Example:
     #cellFound=None
@@ -357,51 +351,50 @@ class Strawberry:
     # Case and whitespace sensitive search.
     # This might not be needed anymore because searching the first column is really only necessary when using chocolate.Strawberry() as cache.xlsx and self.searchCache() was implemented to optimize that use case. When processing every entry in the first column, that implies iterating over every entry anyway, so this function to help find a specific entry to process what would not be used. When is it important to find a specific entry, that is possibly a duplicate, to process outside of cache.xlsx?
     def searchFirstColumn(self, searchTerm):
-        for column in self.spreadsheet.iter_cols():
-            for cell in column:
-                if cell.value == searchTerm:
-                    return self._getRowAndColumnFromRawCellString(cell)[0]
-            break
+        # self.spreadsheet['A'] creates cell A1 if the spreadsheet is empty, and then the next appendRow() would write to row 2 instead of row 1.
+        if self._isEmpty() == True:
+            return None
+        # Only column A is needed, so do not create an iterator over every column just to stop after the first one.
+        for cell in self.spreadsheet['A']:
+            if cell.value == searchTerm:
+                return str(cell.row)
         return None
 
 
     # This returns either [None, None] if there is no cell with the search term, or a list containing the [row, column], the address. Case and whitespace sensitive.
-    #To determine the row, the column, or both from the raw cell address, use self._getRowAndColumnFromRawCellString(rawCellAddress)
     def searchSpreadsheet(self, searchTerm):
-        for row in self.spreadsheet.iter_rows():
-            for cell in row:
-                if cell.value == searchTerm:
-                    return self._getRowAndColumnFromRawCellString(cell)
+        # values_only=True skips handing back a Cell object for every entry. The address can be worked out from the loop counters instead.
+        for rowNumber,row in enumerate( self.spreadsheet.iter_rows(values_only=True), start=1 ):
+            for columnNumber,value in enumerate( row, start=1 ):
+                if value == searchTerm:
+                    return ( str(rowNumber), openpyxl.utils.cell.get_column_letter(columnNumber) )
         return [None, None]
 
 
     # These return either [None,None] if there is no cell with the search term, or a [list] containing the cell row and the cell column (the address in a list). Case insensitive. Whitespace sensitive.
-    # To determine the row, the column, or both from the raw cell address, use self._getRowAndColumnFromRawCellString(rawCellAddress)
+    # casefold() is like lower() but also handles the special cases in unicode, like ß, and the searchTerm only needs to be converted once instead of once per cell.
     def searchRowsCaseInsensitive(self, searchTerm):
-        for row in self.spreadsheet.iter_rows():
-            for cell in row:
-                if isinstance( cell.value, str ):
-                    if cell.value.lower() == str(searchTerm).lower():
-                        return self._getRowAndColumnFromRawCellString(cell)
+        searchTerm=str(searchTerm).casefold()
+        for rowNumber,row in enumerate( self.spreadsheet.iter_rows(values_only=True), start=1 ):
+            for columnNumber,value in enumerate( row, start=1 ):
+                if isinstance( value, str ) and ( value.casefold() == searchTerm ):
+                    return ( str(rowNumber), openpyxl.utils.cell.get_column_letter(columnNumber) )
         return [None, None]
 
 
     def searchColumnsCaseInsensitive(self, searchTerm):
-        for column in self.spreadsheet.iter_cols():
-            for cell in column:
-                if isinstance( cell.value, str ):
-                    if cell.value.lower() == str(searchTerm).lower():
-                        return self._getRowAndColumnFromRawCellString(cell)
+        searchTerm=str(searchTerm).casefold()
+        for columnNumber,column in enumerate( self.spreadsheet.iter_cols(values_only=True), start=1 ):
+            for rowNumber,value in enumerate( column, start=1 ):
+                if isinstance( value, str ) and ( value.casefold() == searchTerm ):
+                    return ( str(rowNumber), openpyxl.utils.cell.get_column_letter(columnNumber) )
         return [None, None]
 
 
     #Give this function a spreadsheet object (subclass of workbook) and it will print the contents of that sheet. #Updated: Moved to Strawberry() class.
     def printAllTheThings(self):
         for row in self.spreadsheet.iter_rows(min_row=1, values_only=True):
-            temp=''
-            for cell in row:
-                temp=temp+','+str(cell)
-            print( str(temp[1:]).encode(consoleEncoding) ) # Ignore first comma , in output
+            printToConsole( ','.join( map(str, row) ) )
 
     #Old example: printAllTheThings(mySpreadsheet)
     #New syntax: 
@@ -425,7 +418,7 @@ class Strawberry:
         elif (outputFileExtensionOnly == '.txt') or (outputFileExtensionOnly == '.text'):
             self.exportToTextFile(outputFileNameWithPath, columnToExport=columnToExportForTextFiles, fileEncoding=self.fileEncoding)
         else:
-            print( ( 'Warning: Unable to export chocolate.Strawberry() to file with unknown extension of \''+ outputFileExtensionOnly + '\' Full path: '+ str(outputFileNameWithPath) ).encode(consoleEncoding) )
+            printToConsole( 'Warning: Unable to export chocolate.Strawberry() to file with unknown extension of \''+ outputFileExtensionOnly + '\' Full path: '+ str(outputFileNameWithPath) )
 
 
     # Supports line by line parsing only. Header should already be part of text file.
@@ -448,7 +441,7 @@ class Strawberry:
     # That is probably the use case that makes the most sense. Translating a plain .txt file and exporting it as a .txt file. Doing spreadsheet -> .txt file exports makes less sense.
     def exportToTextFile(self, fileNameWithPath, columnToExport=None, fileEncoding=defaultTextFileEncoding):
         #print('Hello World'.encode(consoleEncoding))
-        totalLengthOfSpreadsheet=len( getColumn('A') )
+        totalLengthOfSpreadsheet=self.spreadsheet.max_row
         if ( columnToExport == None ) and ( totalLengthOfSpreadsheet <=3 ):
             # The user did not translate anything, so just export the extracted data.
             columnToExport='A'
@@ -476,7 +469,7 @@ class Strawberry:
                     if ( self.addHeaderToTextFile == True ) and ( rowNumber+1 == 1 ):
                         # then skip first row.
                         continue
-                    tempRow=getRow( rowNumber+1 )
+                    tempRow=self.getRow( rowNumber+1 )
                     tempString=tempRow[0]
                     for counter,cell in enumerate( tempRow ):
                         if ( counter > 2 ) and ( cell != None ) and ( cell != '' ):
@@ -486,7 +479,7 @@ class Strawberry:
                         return
                     # This does not handle new lines correctly if there is a new line in tempString.
                     myFileHandle.write(tempString + '\n')
-        print( ( 'Wrote: ' + fileNameWithPath ).encode(consoleEncoding) )
+        printToConsole( 'Wrote: ' + fileNameWithPath )
 
 
     #TODO:
@@ -497,10 +490,10 @@ class Strawberry:
     #Strawberry should have its own methods for writing to files of various formats.
     #All files follow the same rule of the first row being reserved for header values and invalid for inputting/outputting actual data.
     def importFromCSV(self, fileNameWithPath, myFileNameEncoding=defaultTextFileEncoding, removeWhitespaceForCSV=True, csvDialect=None):
-        print( ('Reading from: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Reading from: ' + fileNameWithPath )
         #import languageCodes.csv, but first check to see if it exists
         if os.path.isfile(fileNameWithPath) != True:
-            sys.exit(('\n Error. Unable to find .csv file:"' + fileNameWithPath + '"').encode(consoleEncoding))
+            sys.exit( '\n Error. Unable to find .csv file:"' + fileNameWithPath + '"' )
 
         #tempWorkbook = openpyxl.Workbook()
         #tempSpreadsheet = tempWorkbook.active
@@ -521,54 +514,74 @@ class Strawberry:
             # if csvDialect != None.:
                 # implement code related to csvDialects here. Default options are unix, excel and excel-tab
             myCsvHandle = csv.reader(myFile)
-
+            # Clean up whitespace for entities.
+            # Decide this once here instead of checking removeWhitespaceForCSV again for every row.
+            if removeWhitespaceForCSV == True:
+                myCsvHandle = ( [ entry.strip() for entry in listOfStrings ] for listOfStrings in myCsvHandle )
+            # Look up the append method only once instead of for every row.
+            appendToSpreadsheet=self.spreadsheet.append
+
+            # There is no debug print for every row here. When debug is enabled, printAllTheThings() below prints all of them once the import is done.
             for listOfStrings in myCsvHandle:
-                if debug == True:
-                    print( str(listOfStrings).encode(consoleEncoding) )
-                # Clean up whitespace for entities.
                 for i in range( len(listOfStrings) ):
-                    if removeWhitespaceForCSV == True:
-                        listOfStrings[i]=listOfStrings[i].strip()
                     # Fix types.
-                    if listOfStrings[i].lower() == 'true':
-                        listOfStrings[i]=True
-                    elif listOfStrings[i].lower() == 'false':
-                        listOfStrings[i]=False
-                    elif ( listOfStrings[i].lower() == 'none' ) or ( listOfStrings[i].lower() == '' ):
-                        listOfStrings[i]=None
+                    # Only short entries can be one of the special values, so skip creating a lowercase copy of every long line of text.
+                    if len( listOfStrings[i] ) <= csvMaxLengthOfValueToConvert:
+                        tempValue=listOfStrings[i].lower()
+                        if tempValue in csvValuesToConvert:
+                            listOfStrings[i]=csvValuesToConvert[ tempValue ]
                     # Leave numbers as strings. They should not be processed anyway, so there is no need to mess with them.
 
                     #tempSpreadsheet.append(listOfStrings)
                     #tempSpreadsheet.appendRow(listOfStrings)
 
 
-                self.spreadsheet.append(listOfStrings)
+                appendToSpreadsheet(listOfStrings)
         #return tempWorkbook
-        if debug == True:
+        self._headersIndex=None
+        if debug:
             self.printAllTheThings()
 
 
     def exportToCSV( self, fileNameWithPath, fileEncoding=defaultTextFileEncoding, csvDialect=None ):
-        with open(fileNameWithPath, 'w', newline='', encoding=fileEncoding, errors=outputErrorHandling) as myOutputFileHandle:
+        with open(fileNameWithPath, 'w', newline='', encoding=fileEncoding, errors=outputErrorHandling, buffering=outputFileBufferSize) as myOutputFileHandle:
             # if csvDialect != None.:
                 # implement code related to csvDialects here. Default options are unix, excel and excel-tab
             myCsvHandle = csv.writer(myOutputFileHandle)
 
-            # Get every row for current spreadsheet.
-            # For every row, get each item's value in a list.
-            # myCsvHandle.writerow(thatList)
-            for row in self.spreadsheet.iter_rows(min_row=1, values_only=True):
-                tempList=[]
-                for cell in row:
-                    tempList.append( str(cell) )
-                myCsvHandle.writerow(tempList)
+            # Get every row for current spreadsheet and write them all out at once.
+            # str() is still used on every value so that empty cells are written as None instead of as an empty string. importFromCSV() reads both back as None anyway.
+            myCsvHandle.writerows( map(str, row) for row in self.spreadsheet.iter_rows(min_row=1, values_only=True) )
 
-        print( ('Wrote: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Wrote: ' + fileNameWithPath )
 
 
     def importFromXLSX(self, fileNameWithPath, fileEncoding=defaultTextFileEncoding, sheetNameInWorkbook=None, readOnlyMode=False):
-        print( ('Reading from: '+fileNameWithPath).encode(consoleEncoding) )
-        self.workbook=openpyxl.load_workbook(filename = fileNameWithPath, read_only=readOnlyMode)
+        printToConsole( 'Reading from: ' + fileNameWithPath )
+        # https://openpyxl.readthedocs.io/en/stable/optimized.html
+        # readOnlyMode == True keeps openpyxl's read_only workbook. It parses the rows lazily as they are read instead of building every cell up front, so it is the fastest and uses the least memory, but the spreadsheet cannot be changed afterwards and must be closed with close().
+        # Otherwise, the workbook is loaded normally, so the spreadsheet can be changed and any formatting is kept if it is exported again as .xlsx.
+        if self.writeOnly != True:
+            self.workbook=openpyxl.load_workbook(filename = fileNameWithPath, read_only=readOnlyMode)
+        else:
+            # write_only workbooks cannot hold cells loaded from a file, so load the file as read_only and stream only the values of every row straight through into the write_only workbook instead. Then converting a very large file never needs to hold all of it in memory.
+            # Only the values are copied. Formatting is not.
+            # data_only=True is not used because files written by openpyxl do not have cached values for cells that start with = and those would be read back as None.
+            sourceWorkbook=openpyxl.load_workbook(filename = fileNameWithPath, read_only=True)
+            self.workbook=openpyxl.Workbook( write_only=True )
+            for sourceSpreadsheet in sourceWorkbook.worksheets:
+                tempSpreadsheet=self.workbook.create_sheet( title=sourceSpreadsheet.title )
+                for row in sourceSpreadsheet.iter_rows(values_only=True):
+                    tempSpreadsheet.append( row )
+            activeSpreadsheetName=sourceWorkbook.active.title
+            sourceWorkbook.close()
+
+            # write_only workbooks do not start with a default spreadsheet.
+            if len( self.workbook.sheetnames ) == 0:
+                self.workbook.create_sheet()
+            if activeSpreadsheetName in self.workbook.sheetnames:
+                self.workbook.active=self.workbook[ activeSpreadsheetName ]
+
         if sheetNameInWorkbook == None:
             self.spreadsheet=self.workbook.active
         else:
@@ -578,6 +591,7 @@ class Strawberry:
                 self.workbook.create_sheet( title = str(sheetNameInWorkbook) , index=0 )
                 self.spreadsheet = self.workbook[ sheetNameInWorkbook ]
         self.spreadsheetName=self.spreadsheet.title
+        self._headersIndex=None
 
 
     # https://openpyxl.readthedocs.io/en/stable/optimized.html
@@ -590,30 +604,33 @@ class Strawberry:
         #print('Hello World'.encode(consoleEncoding))
         #Syntax: 
         #theWorkbook.save(filename="myAwesomeSpreadsheet.xlsx")
+        # Copying the rows into a openpyxl.Workbook(write_only=True) before saving was tested, but it was slower than this, ~5s vs ~3s for 100k rows, because the data is already in memory and would have to be walked twice.
+        # write_only only helps when the rows are never held in memory to begin with.
+        # Installing lxml makes saving faster. openpyxl will use it automatically if it is available.
         self.workbook.save(filename=fileNameWithPath)
-        print( ('Wrote: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Wrote: ' + fileNameWithPath )
 
 
     def importFromXLS(self, fileNameWithPath, fileEncoding=defaultTextFileEncoding, sheetNameInWorkbook=None):
-        print('Hello World'.encode(consoleEncoding))
-        #print( ('Reading from: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Hello World' )
+        #printToConsole( 'Reading from: ' + fileNameWithPath )
         #return workbook
 
 
     def exportToXLS(self, fileNameWithPath, fileEncoding=defaultTextFileEncoding):
-        print('Hello World'.encode(consoleEncoding))
-        #print( ('Wrote: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Hello World' )
+        #printToConsole( 'Wrote: ' + fileNameWithPath )
 
 
     def importFromODS(self, fileNameWithPath, fileEncoding=defaultTextFileEncoding, sheetNameInWorkbook=None):
-        print('Hello World'.encode(consoleEncoding))
-        #print( ('Reading from: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Hello World' )
+        #printToConsole( 'Reading from: ' + fileNameWithPath )
         #return workbook
 
 
     def exportToODS(self, fileNameWithPath, fileEncoding=defaultTextFileEncoding):
-        print('Hello World'.encode(consoleEncoding))
-        #print( ('Wrote: '+fileNameWithPath).encode(consoleEncoding) )
+        printToConsole( 'Hello World' )
+        #printToConsole( 'Wrote: ' + fileNameWithPath )
 
 
     # These are methods that try to optimize using chocolate.Strawberry() as cache.xlsx by indexing the first column into a Python dictionary with its associated row number.
@@ -639,10 +656,10 @@ class Strawberry:
             self.lastEntry = 1
         # If this fails, then it should check a variable that if set tries to deduplicate the cache.
         try:
-            assert( len( self.index) + 1 == len( self.getColumn('A') ) )
+            assert( len( self.index) + 1 == self.spreadsheet.max_row )
         except:
             print( 'len( self.index ) + 1=', len( self.index ) )
-            print( 'len( self.getColumn(A) )=', len( self.getColumn('A') ) )
+            print( 'self.spreadsheet.max_row=', self.spreadsheet.max_row )
             print( 'Error: Spreadsheet has duplicate items. Cannot use as cache.\nTip: Use cache.rebuildCache() to remove the duplicate items before trying to initializeCache(). Adding new entries while duplicates exist will corrupt the cache.' )
             raise
 
@@ -679,7 +696,7 @@ class Strawberry:
         tempSearchResult = self.searchCache(myString)
         if tempSearchResult == None:
             # then add it to the main spreadsheet.
-            self.spreadsheet.append( [myString] )
+            self.appendRow( [myString] )
 
             # Update the self.lastEntry as needed.
             self.lastEntry += 1
@@ -775,6 +792,7 @@ class Strawberry:
         # This does not seem to be creating the new spreadsheet with the same name as the old spreadsheet. #Update: Fixed.        self.workbook.create_sheet( title = self.spreadsheetName , index=0 )
         #print(self.workbook.sheetnames)
         self.spreadsheet = self.workbook[ self.spreadsheetName ]
+        self._headersIndex=None
 
         # Add the values into the worksheet.
         # This needs to construct a list [] in the correct order. The first item in the list is the untranslatedEntry and/or the rowDictionary[coreHeader]=value They shoud be the same. The second item is the item specified by the headers dictionary.
@@ -815,7 +833,7 @@ class Strawberry:
         headers=[]
         for entry in mySpreadsheet[1]:
             headers.append(entry.value)
-        print( ( 'initial headers=' + str(headers) ).encode(consoleEncoding) )
+        printToConsole( 'initial headers=' + str(headers) )
         print( 'len(headers)=', len(headers) )
         if len(headers) == 0:
             return None
@@ -840,6 +858,8 @@ class Strawberry:
             # Then it is column B or similar. Move contents to Column A.
             #Add a new column.
             #print('pie')
+            if mySpreadsheet is self.spreadsheet:
+                self._headersIndex=None
             mySpreadsheet.insert_cols(1)
             #Copy values from old column.
             for column in sheet.iter_cols(min_row=keyColumnAsNumber+1, max_row=keyColumnAsNumber+1, values_only=True):
@@ -874,14 +894,14 @@ class Strawberry:
 
             rowKey=mySpreadsheet[ 'A'+ str(rowCounter+1) ].value
             if rowKey == None:
-                print( ('Null key found at row '+ str(rowCounter+1) + '.' ).encode(consoleEncoding) )
+                printToConsole( 'Null key found at row '+ str(rowCounter+1) + '.' )
                 continue
             elif rowKey.strip() == '':
-                print( ('Empty string key found at row '+ str(rowCounter+1) + '.').encode(consoleEncoding) )
+                printToConsole( 'Empty string key found at row '+ str(rowCounter+1) + '.' )
                 continue
 
             if rowKey in tempDatabase.keys():
-                print( ('Duplicate key found at row '+ str(rowCounter+1) + ': '+ rowKey).encode(consoleEncoding) )
+                printToConsole( 'Duplicate key found at row '+ str(rowCounter+1) + ': '+ rowKey )
 
             tempRowDict={}
             for columnCounter,cell in enumerate( row ):
@@ -890,7 +910,7 @@ class Strawberry:
 
             tempDatabase[ rowKey ]=tempRowDict
 
-        print( 'len(mySpreadsheet[A]) before rebuilding=', len(mySpreadsheet['A']) )
+        print( 'mySpreadsheet.max_row before rebuilding=', mySpreadsheet.max_row )
         print( 'len(tempDatabase) after rebuilding=', len(tempDatabase) )
 
         # This cycles through the data to get the row headers, but the row headers will not be added for a particular item if that item is None. 
@@ -36,6 +36,8 @@ knownBinaryFormats=[
 '.xls',
 '.xlsx'
 ]
+# Only the first line ending in a file is needed to detect the line ending schema, so read the file this many characters at a time and stop once it has been found instead of reading the entire file.
+defaultLineEndingsSampleSize=65536
 
 #These must be here or the library will crash even if these modules have already been imported by main program.
 import os.path                                   # Test if file exists.
@@ -56,6 +58,18 @@ try:
 except:
     charsetNormalizerLibraryAvailable = False
 
+#Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
+
+# This prints message to the console as text instead of the b'' representation of print( message.encode( consoleEncoding ) ), so the messages match the ones from py3AnyText2Spreadsheet.py.
+# Characters the console cannot display are replaced using outputErrorHandling instead of crashing the program.
+def printToConsole( message ):
+    try:
+        print( message )
+    except UnicodeEncodeError:
+        stdoutEncoding = getattr( sys.stdout, 'encoding', None ) or consoleEncoding
+        print( message.encode( stdoutEncoding, errors=outputErrorHandling ).decode( stdoutEncoding ) )
+
 
 #Returns a string containing the encoding to use, relied on detectEncoding(filename) but code was merged down.
 #detectEncoding() is never really used, so it should probably just be deleted.
@@ -70,7 +84,7 @@ def detectEncoding(myFileName):
                 break
     temp = detector.result[ 'encoding' ]
     if ( printStuff == True ) and ( debug == True ):
-        print( ( myFileName + ':' + str( detector.result ) ).encode(consoleEncoding) )
+        printToConsole( myFileName + ':' + str( detector.result ) )
     return temp
 
 
@@ -91,7 +105,7 @@ def ofThisFile( myFileName, userInputForEncoding=None, fallbackEncoding=defaultT
     if os.path.isfile( myFileName ) != True:
         # if the user did not specify an encoding and if the file does not exist, just return the fallbackEncoding
         if ( printStuff == True ) and ( verbose == True ):
-            print( ( 'Warning: The file:\'' + myFileName + '\' does not exist. Returning:\'' + fallbackEncoding + '\'' ).encode( consoleEncoding ) )
+            printToConsole( 'Warning: The file:\'' + myFileName + '\' does not exist. Returning:\'' + fallbackEncoding + '\'' )
         return fallbackEncoding
 
     # Assume file exists now.
@@ -124,19 +138,19 @@ def ofThisFile( myFileName, userInputForEncoding=None, fallbackEncoding=defaultT
         #So sometimes, like when detecting an ascii only file or a utf-8 file filled with only ascii, the chardet library will return with a confidence of 0.0 and the result will be None. When that happens, try to catch it and change the result from None to the default encoding. The assumption is that this also happens if the confidence value is below some threshold like <0.2 or <0.5.
         if temp == None:
             if (printStuff == True):# and (debug == True):
-                print(('Warning: Unable to detect encoding of file \'' + myFileName + '\' with high confidence. Using the following fallback encoding:\''+fallbackEncoding+'\'').encode(consoleEncoding))
+                printToConsole( 'Warning: Unable to detect encoding of file \'' + myFileName + '\' with high confidence. Using the following fallback encoding:\''+fallbackEncoding+'\'' )
             temp=fallbackEncoding
         else:
             if debug == True:
-                print((myFileName+':'+str(detector.result)).encode(consoleEncoding))
-            print( ('Warning: Using automatic encoding detection for file:\'' + str(myFileName) + '\' as:\'' + str(temp) +'\'').encode(consoleEncoding) )
+                printToConsole( myFileName+':'+str(detector.result) )
+            printToConsole( 'Warning: Using automatic encoding detection for file:\'' + str(myFileName) + '\' as:\'' + str(temp) +'\'' )
         #temp=detectEncoding(myFileName)
         return temp
 
     elif chardetLibraryAvailable == False:
         #set encoding to default value
         if (printStuff == True) and (debug == True):
-            print( ('Warning: Using default text encoding for file:\'' + str(myFileName) + '\' as:\'' + fallbackEncoding+'\'').encode(consoleEncoding) )
+            printToConsole( 'Warning: Using default text encoding for file:\'' + str(myFileName) + '\' as:\'' + fallbackEncoding+'\'' )
         return fallbackEncoding
 
 
@@ -144,38 +158,55 @@ def ofThisFile( myFileName, userInputForEncoding=None, fallbackEncoding=defaultT
 # This returns ( 'windows', '\r\n' ) or ( 'unix', '\n' ) or ( 'macintosh', '\r' ) .
 # Linux uses unix \n line endings. macintosh \r refers to the very old line ending format used in PPC Macs. OS/X and Intel Macs and newer switched to \n which means most computers use \n .
 # The default output for single line input files is unix \n .
-def detectLineEndingsFromFile( fileNameWithPath, fileEncoding=defaultTextFileEncoding ):
-    with open( fileNameWithPath, 'rt', encoding=fileEncoding, errors='ignore', newline='' ) as myFileHandle:
-        inputFileContents = myFileHandle.read()
-
-    # Debug code.
-    #print( inputFileContents )
-    #print( r'inputFileContents.find(\n)=', inputFileContents.find('\n') )
-    #print( inputFileContents[ inputFileContents.find('\n') - 1 : inputFileContents.find('\n')] )
-    #print( inputFileContents[ inputFileContents.find('\n') - 1 : inputFileContents.find('\n')].encode('utf-8') )
-
-    lineEndingSchema=None
-    lineEndings=None
-    index=inputFileContents.find('\n')
-    #if no \n:
-    if index == -1:
-        # Then it can be either a single line, in which case the line ending schema does not really matter
-        # or if there are a lot of \r, it can be an old macintosh file:
-        if inputFileContents.find('\r') != -1:
-            lineEndingSchema='macintosh'
-            lineEndings='\r'
-        else:
-            # Single line. Does not really matter. Default to unix.
-            lineEndingSchema='unix'
-            lineEndings='\n'
-    elif inputFileContents[ index - 1 : index ] == '\r':
-        lineEndingSchema='windows'
-        lineEndings='\r\n'
+# The file is read sampleSize characters at a time and reading stops at the first \n, so usually only the start of the file is ever read. Only files that have no \n at all are read completely.
+def detectLineEndingsFromFile( fileNameWithPath, fileEncoding=defaultTextFileEncoding, sampleSize=defaultLineEndingsSampleSize ):
+    # If \r and \n are encoded as the same single bytes as in ascii, like for utf-8 and shift-jis, then the file does not need to be decoded to find them.
+    # Other encodings like utf-16 have to be decoded first.
+    try:
+        asciiCompatibleLineEndings = ( '\r\n'.encode( fileEncoding ) == b'\r\n' )
+    except LookupError:
+        asciiCompatibleLineEndings = False
+
+    if asciiCompatibleLineEndings == True:
+        with open( fileNameWithPath, 'rb' ) as myFileHandle:
+            return _detectLineEndingsFromFileHandle( myFileHandle, sampleSize, b'\r', b'\n' )
     else:
-        lineEndingSchema='unix'
-        lineEndings='\n'
+        with open( fileNameWithPath, 'rt', encoding=fileEncoding, errors='ignore', newline='' ) as myFileHandle:
+            return _detectLineEndingsFromFileHandle( myFileHandle, sampleSize, '\r', '\n' )
+
+
+# carriageReturn and lineFeed must be the same type, str or bytes, as what myFileHandle.read() returns.
+def _detectLineEndingsFromFileHandle( myFileHandle, sampleSize, carriageReturn, lineFeed ):
+    foundCarriageReturn = False
+    # The character right before a \n might be at the end of the previous chunk.
+    previousCharacter = carriageReturn[ : 0 ]
+    while True:
+        chunk = myFileHandle.read( sampleSize )
+        if len( chunk ) == 0:
+            break
+
+        index = chunk.find( lineFeed )
+        if index != -1:
+            if index == 0:
+                characterBeforeLineFeed = previousCharacter
+            else:
+                characterBeforeLineFeed = chunk[ index - 1 : index ]
+
+            if characterBeforeLineFeed == carriageReturn:
+                return ( 'windows', '\r\n' )
+            return ( 'unix', '\n' )
+
+        if chunk.find( carriageReturn ) != -1:
+            foundCarriageReturn = True
+        previousCharacter = chunk[ -1 : ]
 
-    return ( lineEndingSchema, lineEndings )
+    #if no \n:
+    # Then it can be either a single line, in which case the line ending schema does not really matter
+    # or if there are a lot of \r, it can be an old macintosh file:
+    if foundCarriageReturn == True:
+        return ( 'macintosh', '\r' )
+    # Single line. Does not really matter. Default to unix.
+    return ( 'unix', '\n' )
 
 
 """
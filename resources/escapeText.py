@@ -65,6 +65,20 @@ __version__='2024.08.07'
 # Import stuff.
 import sys
 import string
+import re
+import functools
+
+#Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
+
+# This prints message to the console as text instead of the b'' representation of print( message.encode( consoleEncoding ) ), so the messages match the ones from py3AnyText2Spreadsheet.py.
+# Characters the console cannot display are replaced using outputErrorHandling instead of crashing the program.
+def printToConsole( message ):
+    try:
+        print( message )
+    except UnicodeEncodeError:
+        stdoutEncoding = getattr( sys.stdout, 'encoding', None ) or consoleEncoding
+        print( message.encode( stdoutEncoding, errors=outputErrorHandling ).decode( stdoutEncoding ) )
 
 # Set defaults.
 consoleEncoding = 'utf-8'
@@ -121,6 +135,44 @@ for i in string.ascii_uppercase:
     alphabetEscapeSequences.append( '\\' + i )
 
 
+# This returns the schema openers and closers as two tuples in the same order, the set of characters that schema openers start with, the set of characters that schema openers or escape sequences start with, if escape sequences can overlap, a compiled regular expression that finds the first schema opener in a string, and another one that finds the first escape sequence in a string. Each regular expression is a single pass over the string instead of one str.find() per key or per sequence.
+# The openers are not put into groups to find out which one matched. A pattern with one group per opener is about 10 times slower to search than a plain alternation because the regular expression engine can no longer reduce it to a set of characters. openers.index() on the matched text is cheap in comparison.
+# The alternatives are kept in the same order as escapeSchemaItems and escapeSequences, so if two of them start at the same index, the first one listed still wins.
+# EscapeText objects are usually created once per line, but almost all of them use the same schema and sequences. Compiling the search patterns for every object would cost more than using them, so the patterns for the most recently used combinations of schema and sequences are remembered and shared by every object that uses that combination.
+@functools.lru_cache( maxsize=128 )
+def _buildSearchPatterns( escapeSchemaItems, escapeSequences ):
+    openers = tuple( key for key,value in escapeSchemaItems )
+    closers = tuple( value for key,value in escapeSchemaItems )
+    openerPattern = re.compile( '|'.join( map( re.escape, openers ) ) )
+    sequencePattern = re.compile( '|'.join( map( re.escape, escapeSequences ) ) )
+    # An empty opener or escape sequence would be found everywhere, so there is no set of characters that can rule it out.
+    if '' in openers:
+        openerFirstCharacters = None
+    else:
+        openerFirstCharacters = frozenset( opener[ 0 ] for opener in openers )
+    if ( openerFirstCharacters == None ) or ( '' in escapeSequences ):
+        markupFirstCharacters = None
+    else:
+        markupFirstCharacters = openerFirstCharacters.union( sequence[ 0 ] for sequence in escapeSequences )
+    sequencesCanOverlap = _escapeSequencesCanOverlap( escapeSequences )
+    return openers, closers, openerFirstCharacters, markupFirstCharacters, sequencesCanOverlap, openerPattern, sequencePattern
+
+
+# This returns True if two escapeSequences, or two copies of the same one, can ever overlap in a string. That happens when one escapeSequence is inside of another one, like 'ab' inside of 'abc', or when the end of one is the start of another one, like 'ab' and 'bc' in 'abc'.
+# If they cannot overlap, then every time any of them appears in a string is a separate match of the sequence regular expression. So the total of str.count() for every escapeSequence is the same as the number of matches.
+def _escapeSequencesCanOverlap( escapeSequences ):
+    if '' in escapeSequences:
+        return True
+    for sequence1 in escapeSequences:
+        for sequence2 in escapeSequences:
+            if ( sequence1 != sequence2 ) and ( sequence1 in sequence2 ):
+                return True
+            for length in range( 1, min( len( sequence1 ), len( sequence2 ) ) ):
+                if sequence1[ -length : ] == sequence2[ : length ]:
+                    return True
+    return False
+
+
 class EscapeText:
     def __init__(self, string, escapeSchema=None, escapeSequences=None):
         self.string=string
@@ -147,6 +199,14 @@ class EscapeText:
         self.escapeSequencesIncludePython = False
         self.escapeSequencesIncludeAss = False
         self.escapeSequencesIncludeSrt = False
+        # The search patterns for the schema and sequences above. These are looked up by _getSearchPatterns() when they are first needed.
+        self._searchPatternsKey = None
+        # The last values of asAList, the text parts in it, and text, and the string and search patterns they were computed from. See _getCachedList().
+        self._cachedString = None
+        self._cachedSearchPatterns = None
+        self._cachedList = None
+        self._cachedTextParts = None
+        self._cachedText = None
 
         self.escapeSequences = userDefinedEscapeSequences.copy()
         if escapeSequences != None:
@@ -156,6 +216,8 @@ class EscapeText:
                     #print(escapeSequences)
                     #if not entry in escapeSequences:
                     self.escapeSequences.append( entry )
+                # Remove duplicates but keep the order. A duplicate escapeSequence would be counted twice by convertStringToList() but only ever found once.
+                self.escapeSequences = list( dict.fromkeys( self.escapeSequences ) )
             elif isinstance( escapeSequences, str ):
                 if escapeSequences == 'python':
                     self.escapeSequences = pythonEscapeSequences
@@ -167,7 +229,7 @@ class EscapeText:
                 elif escapeSequences == 'alphabet':
                     self.escapeSequences = alphabetEscapeSequences
                 else:
-                    print( ('Warning: Invalid escape sequence specified:' + escapeSequences ).encode(consoleEncoding) )
+                    printToConsole( 'Warning: Invalid escape sequence specified:' + escapeSequences )
 
         # Old syntax:
         #self.asAList=self.convertStringToList( self.string )
@@ -199,13 +261,8 @@ class EscapeText:
     #@property
     #def asAList( self ):
     def get_asAList( self ):
-        # convertStringToList() sometimes returns empty strings as list items. This is a lazy fix to that bug.
-        tempList = [ ]
-        tempList2 = self.convertStringToList( self.string )
-        for entry in tempList2:
-            if entry != '':
-                tempList.append( entry )
-        return tempList
+        # Return a copy so changing the returned list does not change the cached one.
+        return list( self._getCachedList() )
 
     #@asAList.setter
     #def asAList(self, value):
@@ -225,22 +282,40 @@ class EscapeText:
 
     @property
     def text(self):
-        tempText=''
-        #print(self.asAList)
-        #print(type( self.asAList) )
-        #print(len( self.asAList) )
-        #assert( self.asAList != None )
-        for item in self.asAList:
-            #print(item)
-            if isinstance( item, str ):
-                tempText=tempText + item
-        return tempText
+        # _getCachedList() clears self._cachedText whenever the list has to be computed again, so it must be called first.
+        self._getCachedList()
+        if self._cachedText == None:
+            self._cachedText = ''.join( self._cachedTextParts )
+        return self._cachedText
 
     @text.setter
     def text(self, value):
         _text=value
 
 
+    # Converting the string into a list is most of the work this class does, and the list is read several times for the same string by text, getTranslatedStringWithEscapesInserted(), and convertTranslatedStringToList().
+    # So, keep the last list along with the string and the search patterns it was computed from, and only compute it again after self.string, self.escapeSchema, or self.escapeSequences change. _getSearchPatterns() returns the same shared object for the same schema and sequences while they are cached, so comparing with 'is' is enough for those.
+    # The text parts, the entries that are strings, are also kept in self._cachedTextParts so text and convertTranslatedStringToList() do not have to check the type of every entry again every time.
+    def _getCachedList( self ):
+        searchPatterns = self._getSearchPatterns()
+        if ( self._cachedSearchPatterns is not searchPatterns ) or ( self._cachedString != self.string ):
+            # convertStringToList() sometimes returns empty strings as list items. This is a lazy fix to that bug.
+            tempList = [ ]
+            textParts = [ ]
+            tempList2 = self.convertStringToList( self.string )
+            for entry in tempList2:
+                if entry != '':
+                    tempList.append( entry )
+                    if isinstance( entry, str ):
+                        textParts.append( entry )
+            self._cachedList = tempList
+            self._cachedTextParts = textParts
+            self._cachedText = None
+            self._cachedString = self.string
+            self._cachedSearchPatterns = searchPatterns
+        return self._cachedList
+
+
     # Adds another schema which is a pair of items to exclude all text in the middle.
     def addEscapeSchema(self, myPair ):
         assert( len(myPair) == 2 )
@@ -250,14 +325,29 @@ class EscapeText:
     # Adds another escapeSequence to the list. These are always treated literally.
     # For special behavior, like \u means remove \u and the next 2 characters after \u, then that requires special handling and adjusting the code manually.
     # Is there a way to automate that? Maybe addSpecialEscapeSequence( \u, 5) where 5 is the number of characters after \u to remove? Humm.
+    # Sequences that are already in the list are not added again.
     def addEscapeSequence(self, myItem ):
+        # Build a new list instead of appending to the current one. self.escapeSequences might be one of the lists at the top of this file, like pythonEscapeSequences, that other EscapeText objects also use.
+        tempList = list( self.escapeSequences )
         if isinstance( myItem, str):
-            self.escapeSequences.append(myItem)
+            tempList.append(myItem)
         elif isinstance( myItem, (list, tuple) ):
             for i in myItem:
-                self.escapeSequences.append(myItem)
+                tempList.append(i)
         else:
             print( 'Unrecognized type when adding escape sequence.' )
+            return
+        self.escapeSequences = list( dict.fromkeys( tempList ) )
+
+
+    # This returns the search patterns from _buildSearchPatterns() for the current self.escapeSchema and self.escapeSequences.
+    # self.escapeSchema and self.escapeSequences can be changed after the object is created, so the patterns are looked up again whenever they no longer match the current schema and sequences.
+    def _getSearchPatterns( self ):
+        searchPatternsKey = ( tuple( self.escapeSchema.items() ), tuple( self.escapeSequences ) )
+        if self._searchPatternsKey != searchPatternsKey:
+            self._searchPatterns = _buildSearchPatterns( searchPatternsKey[ 0 ], searchPatternsKey[ 1 ] )
+            self._searchPatternsKey = searchPatternsKey
+        return self._searchPatterns
 
 
     # This function converts: 'pie {\i0}pies{\i}, piez'
@@ -268,145 +358,131 @@ class EscapeText:
     # For every schema, assign an index.
     # The schema that has the lowest index takes priority.
     # Process that schema with the lowest index. Process means split any contents before the start character in the schema into a list as a string 'pie '. Then remove that string and the schema as a tuple ('{\i0}', adding both to the list. Decriment sanity counter by 1 every time a schema is removed from the string and added to the ongoing list. And then process the next schema from the start of the new string. At the end, assert counter == 0.
-    # Next, for each entry in the list that is a string process each string for escape sequences and split the entry in the list accordingly.
+    # Next, process every string for escape sequences as soon as it is found and split it into multiple entries in the list accordingly.
     # Same algorithim as above. Try to find the first escape sequence that occurs in the string, and split based upon that. Until more escape sequences remain in the string, continue.
     # return the list
     # Bug: There is this bug where if multiple escape schema are in one line, then only the first one detected will be removed. # Update fixed. Problem was not clearing  currentLowestIndex = [ None, None ]  on every iteration of the loop.
     # New bug: Sometimes, but not always, an empty string gets appended when going from print(tempList) \n assert( schemaFoundCounter == 0 ) -> end of escapeSequences processing code when a text entry consists solely of an escapeSequence.
     def convertStringToList( self, string ):
+        openers, closers, openerFirstCharacters, markupFirstCharacters, sequencesCanOverlap, openerPattern, sequencePattern = self._getSearchPatterns()
+
+        # Most strings have no schema and no escape sequences in them at all. If none of the characters that either of them start with are in the string, then there is nothing to split.
+        if ( markupFirstCharacters != None ) and ( markupFirstCharacters.isdisjoint( string ) == True ):
+            return [ string ]
+
         schemaFoundCounter = 0
-        for key,value in self.escapeSchema.items():
-            if ( string.find( key ) != -1 ) and ( string.find( value ) != -1 ):
-                schemaFoundCounter = schemaFoundCounter + string.count( key )
+        # Most strings do not have any schema in them at all. If none of the characters that an opener starts with are in the string, then there is no need to search for and count every key.
+        if ( openerFirstCharacters == None ) or ( openerFirstCharacters.isdisjoint( string ) == False ):
+            # This count is also what limits how many schema get processed below, so it cannot be replaced by just searching until no more openers are found. Openers that do not have their closer anywhere in the string are not counted, so '{a}<b' keeps '<b' as text instead of discarding it.
+            # str.count() already returns 0 when the key is not in the string, so there is no need to find() the key first.
+            for key,value in zip( openers, closers ):
+                keyCount = string.count( key )
+                if ( keyCount != 0 ) and ( value in string ):
+                    schemaFoundCounter = schemaFoundCounter + keyCount
 
         #print( 'schemaFoundCounter=' + str(schemaFoundCounter) )
         schemaFoundCounterBackup = schemaFoundCounter
+
+        # Every piece of text is split up by escapeSequences as soon as it is found instead of building the whole list first and then going over it again to split the text entries in it.
+        # sequencePattern would match everywhere if there are no escapeSequences, so do not use it at all then.
+        if len( self.escapeSequences ) == 0:
+            sequencePattern = None
+
         tempList = []
         if schemaFoundCounter == 0:
-            tempList.append( string )
+            self._appendTextWithEscapeSequences( tempList, string, sequencePattern, sequencesCanOverlap )
         #else:
-        tempString=string
+        # Look up these methods once instead of on every iteration.
+        searchForOpener = openerPattern.search
+        appendToTempList = tempList.append
+        currentPosition = 0
         for i in range( schemaFoundCounter ):
-            # [index, first pair in self.escapeSchema]
-            currentLowestIndex = [ None, None ]
-            for key,value in self.escapeSchema.items():
-                if tempString.find( key ) != -1: # This should be redundant because the loop should only iterate over the string as many times as key, the first part of a schema like {, appears in the string. Update: No. It is always needed. Not clear why though. Update: Maybe because there are different schema in different parts of the string and the remainder of the string will not necessarily have every schema? Without this, tempString.find( key ) == -1 if it is not found which is < currentLowestIndex[0] and hence would corrupt the index.
-                    if currentLowestIndex[0] == None:
-                        currentLowestIndex = [ tempString.find( key ), key ]
-                    # if the next key has a lower index than the current one
-                    elif tempString.find( key ) < currentLowestIndex[0]:
-                        currentLowestIndex = [ tempString.find( key ), key ]
-            #index = tempString.find( currentLowestIndex[1] )
-            index = currentLowestIndex[0]
-            if index != 0:
-                preString = tempString.partition( currentLowestIndex[1] )[0]
-                tempList.append( preString ) # Append text as a string.
-                tempString = currentLowestIndex[1] + tempString.partition( currentLowestIndex[1] )[2]
-            # index is now 0.
-            endIndex = tempString.find( self.escapeSchema[ currentLowestIndex[1] ] )
-            tempList.append([ tempString[ 0 : endIndex + 1 ] ]) # Append the schema as a list to differentiate it from the unescaped text which are added as strings.
-            tempString = tempString.partition( self.escapeSchema[ currentLowestIndex[1] ])[2]
-            #print( tempString )
+            # The key that has the lowest index takes priority. If two keys are found at the same index, then the first one in self.escapeSchema wins.
+            match = searchForOpener( string, currentPosition )
+            index, openerEndIndex = match.span()
+
+            if index != currentPosition:
+                self._appendTextWithEscapeSequences( tempList, string[ currentPosition : index ], sequencePattern, sequencesCanOverlap ) # Append text as a string.
+            # index is now the start of the schema.
+            closer = closers[ openers.index( string[ index : openerEndIndex ] ) ]
+            endIndex = string.find( closer, index )
+            if endIndex == -1:
+                # If the closer is not in the rest of the string, then the rest of the string is discarded.
+                appendToTempList( [ '' ] )
+                currentPosition = len( string )
+            else:
+                appendToTempList( [ string[ index : endIndex + 1 ] ] ) # Append the schema as a list to differentiate it from the unescaped text which are added as strings.
+                currentPosition = endIndex + len( closer )
             schemaFoundCounter -= 1
             if ( ( i + 1 ) == schemaFoundCounterBackup ):
-                tempList.append( tempString )
+                self._appendTextWithEscapeSequences( tempList, string[ currentPosition : ], sequencePattern, sequencesCanOverlap )
 
         #print(tempList)
         assert( schemaFoundCounter == 0 )
 
-        #for key,value in self.escapeSchema.items():
-        #    if ( string.find( key ) != -1 ) and ( string.find( value ) != -1 ):
-        #        schemaFoundCounter=schemaFoundCounter + string.count( key )
-        #assert( schemaFoundCounter == 0 )
-
-        if len( self.escapeSequences ) == 0:
-            return tempList
+        return tempList
 
-        # Some string entries in tempList need to be split into multiple entries in-place which means the original entry gets removed and an arbitrary number of new entries added. Since looping over tempList is required to determine those mappings and it is probably not a good idea to modify the list while iterating through it, put the string as a key in adjustEntryMappings, a Python dictionary, that maps that key to a list of every item that belongs in place of that string for reinsertion later.
-        adjustEntryMappings = {}
 
-        for entry in tempList:
-            if isinstance( entry, str ):
-                tempList2 = []
-                escapeSequenceFoundCounter = 0
-                tempString = entry
-
-                #print(self.escapeSequences)
-                for item in self.escapeSequences:
-                    if tempString.find( item ) != -1:
-                        escapeSequenceFoundCounter = escapeSequenceFoundCounter + tempString.count( item )
-                        #print(escapeSequenceFoundCounter)
-                        #print(item)
-                        #print(tempString)
-
-                if escapeSequenceFoundCounter == 0:
-                    continue
-
-                escapeSequenceFoundCounterBackup=escapeSequenceFoundCounter
-                #print(escapeSequenceFoundCounterBackup)
-
-                for i in range( escapeSequenceFoundCounter ):
-                    currentLowestIndex=[ None, None ]
-                    for item in self.escapeSequences:
-                        if tempString.find( item ) != -1:
-                            if currentLowestIndex[0] == None:
-                                currentLowestIndex=[ tempString.find( item ), item ]
-                            elif currentLowestIndex[0] > tempString.find( item ):
-                                currentLowestIndex=[ tempString.find( item ), item ]
-
-                    #print(escapeSequenceFoundCounterBackup)
-                    #print(currentLowestIndex)
-                    index = tempString.find( currentLowestIndex[1] )
-                    if index != 0:
-                        preString = tempString.partition( currentLowestIndex[1] )[0]
-                        tempList2.append( preString ) # Append text as a string.
-                        tempString = currentLowestIndex[1] + tempString.partition( currentLowestIndex[1] )[2]
-                    # index is now 0.
-                    endIndex = tempString.find( currentLowestIndex[1] )
-                    # TODO: Certain escapeSequences need to be handled differently like \u \u \o? \h? if certain flags are set. Check for them here. Specifically, the length of currentLowestIndex[1] might need to be adjusted
-                    tempList2.append([ tempString[ 0 : endIndex + len( currentLowestIndex[1] ) ] ]) # Append the escapeSequence itself as a list.
-                    tempString = tempString.partition( currentLowestIndex[1] )[2]
-                    escapeSequenceFoundCounter -= 1
-                    if ( ( i + 1 ) == escapeSequenceFoundCounterBackup ):
-                        tempList2.append( tempString )
-
-                assert( escapeSequenceFoundCounter == 0 )
-
-                adjustEntryMappings[ entry ] = tempList2.copy()
-
-        #print('adjustEntryMappings=' + str(adjustEntryMappings) )
-
-        if len( adjustEntryMappings ) > 0:
-            # With the enumerate() syntax, the list will keep getting extended and listCounter will keep incrementing as the list grows. That could potentially lead to an infinite loop with exactly the wrong data. To avoid that possibility, keep listCounter outside of the loop and manage it manually. Copy the list as well to prevent iteration through the newly inserted items completely. # Safety first.
-            listCounter = 0
-            for entry in tempList.copy():
-                if isinstance(entry, str):
-                    if entry in adjustEntryMappings:
-                        # Then replace the current list item with the items in adjustEntryMappings.
-                        tempList.remove(entry)
-                        for entry2 in reversed( adjustEntryMappings[ entry ] ):
-                            tempList.insert( listCounter, entry2 )
-                        listCounter = listCounter + len( adjustEntryMappings[ entry ] )
-                        continue
-                listCounter+=1
+    # This appends text to tempList split up into text and escapeSequences. The text parts are appended as strings and the escapeSequences are appended as lists, like for the schema in convertStringToList().
+    # sequencePattern is None if there are no escapeSequences.
+    def _appendTextWithEscapeSequences( self, tempList, text, sequencePattern, sequencesCanOverlap ):
+        # One pass with sequencePattern finds any of the escapeSequences at once, so text that does not have any of them, which is most of it, is appended as-is without counting every escapeSequence separately.
+        if ( sequencePattern == None ) or ( sequencePattern.search( text ) == None ):
+            tempList.append( text )
+            return
 
-        return tempList
+        escapeSequenceFoundCounter = 0
+        #print(self.escapeSequences)
+        if sequencesCanOverlap == False:
+            # Then one pass with sequencePattern finds all of them. See _escapeSequencesCanOverlap().
+            escapeSequenceFoundCounter = len( sequencePattern.findall( text ) )
+        else:
+            # Like for the schema, str.count() already returns 0 when the escapeSequence is not in the string, so there is no need to find() it first.
+            for item in self.escapeSequences:
+                escapeSequenceFoundCounter = escapeSequenceFoundCounter + text.count( item )
+
+        if escapeSequenceFoundCounter == 0:
+            tempList.append( text )
+            return
+
+        escapeSequenceFoundCounterBackup=escapeSequenceFoundCounter
+        #print(escapeSequenceFoundCounterBackup)
+
+        # Like for the schema, keep track of the current position in the string instead of cutting the string up after every escapeSequence.
+        searchForSequence = sequencePattern.search
+        appendToTempList = tempList.append
+        currentPosition = 0
+        for i in range( escapeSequenceFoundCounter ):
+            # The escapeSequence that has the lowest index takes priority. If two are found at the same index, then the first one in self.escapeSequences wins.
+            index, sequenceEndIndex = searchForSequence( text, currentPosition ).span()
+            if index != currentPosition:
+                appendToTempList( text[ currentPosition : index ] ) # Append text as a string.
+            # index is now the start of the escapeSequence.
+            # TODO: Certain escapeSequences need to be handled differently like \u \u \o? \h? if certain flags are set. Check for them here. Specifically, sequenceEndIndex might need to be adjusted
+            appendToTempList([ text[ index : sequenceEndIndex ] ]) # Append the escapeSequence itself as a list.
+            currentPosition = sequenceEndIndex
+            escapeSequenceFoundCounter -= 1
+            if ( ( i + 1 ) == escapeSequenceFoundCounterBackup ):
+                appendToTempList( text[ currentPosition : ] )
+
+        assert( escapeSequenceFoundCounter == 0 )
 
 
     # This returns a string with all of the escape characters inserted into the string.
     def getTranslatedStringWithEscapesInserted( self, translatedString ):
-        tempString=''
+        # Collect the parts in a list and join them once at the end instead of creating a new string for every part.
+        tempList=[]
 
         translatedStringAsAList = self.convertTranslatedStringToList( translatedString )
         currentTranslatedStringEntry = 0
-        for entry in self.asAList:
+        for entry in self._getCachedList():
             if isinstance( entry, str ):
-                tempString = tempString + translatedStringAsAList[ currentTranslatedStringEntry ]
+                tempList.append( translatedStringAsAList[ currentTranslatedStringEntry ] )
                 currentTranslatedStringEntry+=1
             #elif isinstance( entry, list ):
             else:
-                tempString=tempString + entry[0]
-        return tempString
+                tempList.append( entry[0] )
+        return ''.join( tempList )
 
     # These next two functions together perform a psudo lexical analysis based upon the position of strings and a delimiter to determine where they should be reinserted.
     # Algorithim:
@@ -425,17 +501,13 @@ class EscapeText:
     # if the last character in the string is not a blank space ' ', then adjust the index left or right based upon goLeftForSplitMode boolean.
     # TODO: There should be special handling for escape schema and sequences that appear at the start and end of the string to boost insertion accuracy in these cases.
     def convertTranslatedStringToList( self, translatedString ):
-        originalStringInAList = [ ]
-        for i in self.asAList:
-            if isinstance( i, str ):
-                originalStringInAList.append( i )
+        self._getCachedList()
+        originalStringInAList = self._cachedTextParts
         #print( originalStringInAList )
         numberOfPartsToSplit = len( originalStringInAList )
         #print( numberOfPartsToSplit )
-        tempString = ''
-        for i in originalStringInAList:
-            tempString = tempString + i
-        originalStringLength = len( tempString )
+        # Only the length of the parts together is needed, so add up their lengths instead of putting the parts together into a new string.
+        originalStringLength = sum( map( len, originalStringInAList ) )
 
         translatedStringAfterBeingSplit = []
 
@@ -446,16 +518,19 @@ class EscapeText:
             # do stuff
             previousPartLength = 0
             previousPartEndIndex = 0
+            translatedStringLength = len( translatedString )
             for i in range( numberOfPartsToSplit ):
                 currentPart = originalStringInAList[ i ]
-                currentPartLengthRaw = int( len( currentPart ) / originalStringLength * len( translatedString ) )
+                # The approximate length of this part in the translated string, based upon how long it was in the original string.
+                currentPartLengthApproximate = len( currentPart ) / originalStringLength * translatedStringLength
+                currentPartLengthRaw = int( currentPartLengthApproximate )
                 #print( 'len( currentPart )=', len( currentPart ) )
                 #print( 'len( originalStringLength )=', originalStringLength )
                 #print( 'len( translatedString )=', len( translatedString ) )
                 #print( len( currentPart ) / originalStringLength * len( translatedString ) )
 
                 # The point of this highly confusing code block is to round up or down based upon the factional part of currentPartLengthRaw like 23.67 -> 24, instead of int(23.67) -> 23, so the approximate index is as accurate as possible which should mean more accurate splits.
-                currentPartLengthRawFraction=( len( currentPart ) / originalStringLength * len( translatedString ) ) - currentPartLengthRaw
+                currentPartLengthRawFraction = currentPartLengthApproximate - currentPartLengthRaw
                 #print( currentPartLengthRaw )
                 #print( currentPartLengthRawFraction )
                 currentPartLengthRaw = currentPartLengthRaw + int( round( currentPartLengthRawFraction, 0 ) )
@@ -499,19 +574,19 @@ class EscapeText:
             adjustedIndex=approximateIndex
         # Normal/unlucky.
         else:
+            # find() and rfind() take start and end positions, so there is no need to copy part of the string into a new string just to search it.
             if self.goLeftForSplitMode == True:
                 # Take part 1 of the string and find the last empty space ' '.
-                adjustedIndex=translatedString[ : approximateIndex ].rfind( self.splitDelimiter )
+                adjustedIndex=translatedString.rfind( self.splitDelimiter, 0, approximateIndex )
                 # failure case
                 if adjustedIndex == -1:
                     return approximateIndex
             else:
                 # Take the rest of the string that is not part 1 and find the first empty space ' '.
-                adjustedIndex=translatedString[ approximateIndex :  ].find( self.splitDelimiter )
+                adjustedIndex=translatedString.find( self.splitDelimiter, approximateIndex )
                 # failure case
                 if adjustedIndex == -1:
                     return approximateIndex
-                adjustedIndex=approximateIndex + adjustedIndex
 
         try:
             assert( translatedString[ adjustedIndex : adjustedIndex + 1 ] == self.splitDelimiter )
@@ -33,9 +33,10 @@ defaultTextFileEncoding = 'utf-8'   # Settings that should not be left as a defa
 linesThatBeginWithThisAreComments = '#'
 assignmentOperatorInSettingsFile = '='
 
-# Why yahoo? They are unlikely to go anywhere any time soon, and they do not filter the requests library.
-#domainWithoutProtocolToResolveForInternetConnectivity = 'yahoo.com'
-domainWithProtocolToResolveForInternetConnectivity = 'https://yahoo.com'
+# Why yahoo? They are unlikely to go anywhere any time soon, and they do not filter automated connections.
+domainWithoutProtocolToResolveForInternetConnectivity = 'yahoo.com'
+#domainWithProtocolToResolveForInternetConnectivity = 'https://yahoo.com'
+portToConnectToForInternetConnectivity = 443
 defaultTimeout = 10
 
 defaultWordWrapLength = 60
@@ -148,6 +149,10 @@ halfWidthAsciiToFullWidthMap={
 fullWidthToHalfWidthAsciiMap={}
 for key,item in halfWidthAsciiToFullWidthMap.items():
     fullWidthToHalfWidthAsciiMap[ item ] = key
+# Translation tables for str.translate() which converts every character in a string in a single pass.
+# str.maketrans() only accepts single characters as keys, so '...' is left out. It was never converted anyway since strings are converted one character at a time.
+halfWidthAsciiToFullWidthTable = str.maketrans( { key : item for key,item in halfWidthAsciiToFullWidthMap.items() if len( key ) == 1 } )
+fullWidthToHalfWidthAsciiTable = str.maketrans( fullWidthToHalfWidthAsciiMap )
 
 inputErrorHandling = 'strict'
 #outputErrorHandling = 'namereplace'  # This gets set dynamically below.
@@ -160,11 +165,11 @@ import sys                                   # End program on fail condition.
 import os, os.path                      # Extract extension from filename, and test if file exists.
 import pathlib                            # For pathlib.Path Override file in file system with another and create subfolders. Sane path handling.
 #import requests                          # Check if internet exists. # Update: Changed to socket library instead, so this is not needed anymore.
-import socket
+import socket                             # Check if internet exists.
 #import io                                      # Manipulate files (open/read/write/close).
 import datetime                          # Used to get current date and time.
 import csv                                    # Read and write to csv files. Example: Read in 'resources/languageCodes.csv'
-import openpyxl                          # Used as the core internal data structure and to read/write xlsx files. Must be installed using pip.
+#import openpyxl                          # Used as the core internal data structure and to read/write xlsx files. Must be installed using pip. openpyxl is slow to import, so it is imported by the functions that use it instead.
 try:
     import odfpy                           #Provides interoperability for Open Document Spreadsheet (.ods).
     odfpyLibraryIsAvailable = True
@@ -177,10 +182,16 @@ except:
     xlrdLibraryIsAvailable = False
 
 #Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling = 'namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling = 'backslashreplace'    
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
+
+# This prints message to the console as text instead of the b'' representation of print( message.encode( consoleEncoding ) ), so the messages match the ones from py3AnyText2Spreadsheet.py.
+# Characters the console cannot display are replaced using outputErrorHandling instead of crashing the program.
+def printToConsole( message ):
+    try:
+        print( message )
+    except UnicodeEncodeError:
+        stdoutEncoding = getattr( sys.stdout, 'encoding', None ) or consoleEncoding
+        print( message.encode( stdoutEncoding, errors=outputErrorHandling ).decode( stdoutEncoding ) )
 
 
 # This assumes string has no \n and will try to insert them based upon wordWrapLength up to the maximumNumberOfLines. There is no gurantee the output will have a certain number of lines. To gurantee that, set forceOutputToMatchMaxLines=True. Currently, if forceOutputToMatchMaxLines == True, then the output can potentially be very ugly.
@@ -198,8 +209,8 @@ def wordWrap( string, wordWrapLength=defaultWordWrapLength, maximumNumberOfLines
         #print('apple')
         # if processing the last line, then just append the leftovers and return.
         if ( i + 1 == maximumNumberOfLines ) or ( string == '' ):
-            tempString2 = tempString.split( '\n' )
-            previousPart=tempString2[ len(tempString2) - 1 ]
+            # Only the last line is needed, so there is no need to split every line into a list.
+            previousPart=tempString[ tempString.rfind( '\n' ) + 1 : ]
             #print( 'len(previousPart)=',len(previousPart) )
             #print( 'len(string)=', len(string) )
             #print( ('tempString='+ tempString ).encode(consoleEncoding) )
@@ -211,7 +222,8 @@ def wordWrap( string, wordWrapLength=defaultWordWrapLength, maximumNumberOfLines
            # print( 'pie2' )
             break
 
-        adjustedIndex = string[ : wordWrapLength ].rfind( ' ' )
+        # rfind() can search only the first wordWrapLength characters without copying them into a new string first.
+        adjustedIndex = string.rfind( ' ', 0, wordWrapLength )
         if adjustedIndex == -1:
             currentLine = string[ : wordWrapLength ].strip()
             string = string[ wordWrapLength : ].strip()
@@ -238,8 +250,8 @@ def wordWrap( string, wordWrapLength=defaultWordWrapLength, maximumNumberOfLines
 
         # if processing the last line, then just append the leftovers and return.
         if ( i + 1 == maximumNumberOfLines ) or ( string == '' ):
-            tempString2 = tempString.split( '\n' )
-            previousPart=tempString2[ len(tempString2) - 1 ]
+            # Only the last line is needed, so there is no need to split every line into a list.
+            previousPart=tempString[ tempString.rfind( '\n' ) + 1 : ]
             #print( 'len(previousPart)=',len(previousPart) )
             #print( 'len(string)=', len(string) )
             #print( ('tempString='+ tempString ).encode(consoleEncoding) )
@@ -262,24 +274,35 @@ def wordWrap( string, wordWrapLength=defaultWordWrapLength, maximumNumberOfLines
         if count != maximumNumberOfLines:
             splitAmount = int( len( originalString ) / maximumNumberOfLines )
             #print( 'splitAmount=', splitAmount )
-            tempString = ''
-            for i in range( 0, maximumNumberOfLines, 1 ):
-                if i == 0:
-                    tempString = originalString[ splitAmount * i : splitAmount * ( i + 1 ) ]
-                    #print(tempString)
-                    #tempString = originalString[ splitAmount * ( i + 1 ) : ]
-                    #print(tempString)
-                    #print( splitAmount * ( i + 1 ) )
-                else:
-                    #print( splitAmount * ( i + 1 ) )
-                    if ( i + 1 ) == maximumNumberOfLines:
-                        tempString = tempString + '\n' + originalString[ splitAmount * i : ]
-                    else:
-                        tempString = tempString + '\n' + originalString[ splitAmount * i : splitAmount * ( i + 1 ) ]
+            # Collect the lines into a list and join them once at the end instead of growing tempString one line at a time.
+            tempList = [ ]
+            for i in range( 0, maximumNumberOfLines - 1, 1 ):
+                tempList.append( originalString[ splitAmount * i : splitAmount * ( i + 1 ) ] )
+            # The last line gets the leftovers.
+            tempList.append( originalString[ splitAmount * ( maximumNumberOfLines - 1 ) : ] )
+            tempString = '\n'.join( tempList )
 
     return tempString
 
 
+# wordWrapMany() is wordWrap() for a list of strings, like every row in a column of a spreadsheet. It returns a new list.
+# Most rows are already short enough to fit on one line, so those are stripped and returned directly instead of calling wordWrap() for each one.
+def wordWrapMany( strings, wordWrapLength=defaultWordWrapLength, maximumNumberOfLines=defaultWordWrapMaxNumberOfLines, forceOutputToMatchMaxLines=False ):
+    if ( maximumNumberOfLines == 1 ) and ( forceOutputToMatchMaxLines == False ):
+        return [ string.strip() for string in strings ]
+
+    tempList = [ ]
+    appendToList = tempList.append
+    for string in strings:
+        if forceOutputToMatchMaxLines == False:
+            strippedString = string.strip()
+            if len( strippedString ) <= wordWrapLength:
+                appendToList( strippedString )
+                continue
+        appendToList( wordWrap( string, wordWrapLength=wordWrapLength, maximumNumberOfLines=maximumNumberOfLines, forceOutputToMatchMaxLines=forceOutputToMatchMaxLines ) )
+    return tempList
+
+
 # This returns True or False depending upon if the string can be encoded using the target encoding.
 def checkEncoding( string, encoding ):
     try:
@@ -291,14 +314,22 @@ def checkEncoding( string, encoding ):
 def normalizeEncoding( string, encoding ):
     if checkEncoding( string, encoding ) == True:
         return string
-    # Okay, so, something messed up. What was it? Check character by character and klobber the offender.
-    tempString = ''
-    for i in range( len( string ) ):
-        if checkEncoding( string[ i : i + 1 ], encoding ) == True:
-            tempString = tempString + string[ i : i + 1 ]
-        else:
-            print( ( 'Warning: ' + string[ i : i + 1 ] + ' cannot be encoded to valid ' + encoding + '.' ).encode( consoleEncoding ) )
-    print( ( 'Warning: Output changed to: \'' + tempString + '\'' ).encode( consoleEncoding ) )
+    # Okay, so, something messed up. What was it? Klobber the offenders.
+    # Instead of checking character by character, encode the rest of the string and let the UnicodeEncodeError say where the characters that cannot be encoded are. That is one encode() per offending run of characters instead of one per character.
+    tempList = [ ]
+    currentPosition = 0
+    while True:
+        try:
+            string[ currentPosition : ].encode( encoding )
+            tempList.append( string[ currentPosition : ] )
+            break
+        except UnicodeEncodeError as error:
+            tempList.append( string[ currentPosition : currentPosition + error.start ] )
+            for i in string[ currentPosition + error.start : currentPosition + error.end ]:
+                printToConsole( 'Warning: ' + i + ' cannot be encoded to valid ' + encoding + '.' )
+            currentPosition = currentPosition + error.end
+    tempString = ''.join( tempList )
+    printToConsole( 'Warning: Output changed to: \'' + tempString + '\'' )
     return tempString
 
 
@@ -308,22 +339,20 @@ def halfToFullWidthAscii( string ):
     if string == '':
         return ''
 
-    tempString = ''
-    error = False
-    for i in string:
-        if i in halfWidthAsciiToFullWidthMap.keys():
-            tempString=tempString + halfWidthAsciiToFullWidthMap[ i ]
-        else:
-            tempString=tempString + i
-            if error == False:
-                error = True
+    tempString = string.translate( halfWidthAsciiToFullWidthTable )
 
     if debug == True:
-        print( tempString.encode( consoleEncoding ) )
+        # Only the debug message needs to know if there were any characters that could not be converted.
+        error = False
+        for i in string:
+            if not i in halfWidthAsciiToFullWidthMap:
+                error = True
+                break
+        printToConsole( tempString )
         print( tempString == string )
         if error == True:
             # This will also error out if there are any characters that are already full width.
-            print( ( 'Warning, unable to convert all characters to full width in string: \'' + string + '\'' ).encode( consoleEncoding ) )
+            printToConsole( 'Warning, unable to convert all characters to full width in string: \'' + string + '\'' )
     return tempString
 
 
@@ -333,27 +362,22 @@ def fullToHalfWidthAscii( string ):
     if string == '':
         return ''
 
-    tempString = ''
-    error = False
-    for i in string:
-        if i in fullWidthToHalfWidthAsciiMap.keys():
-            # Slow. Is there a better way of doing this? No right? # Update: The way to do this faster is to use the same dictionary but mapped the reverse way. Always keeping the correct mapping table in memory will speed up processing here. # Update2: Done.
-            #for key,value in fullWidthToHalfWidthAsciiMap.items():
-            #    if i == value:
-            #        tempString = tempString + key
-            #        break
-            tempString = tempString + fullWidthToHalfWidthAsciiMap[ i ]
-        else:
-            tempString = tempString + i
-            if error == False:
-                error = True
+    # Slow. Is there a better way of doing this? No right? # Update: The way to do this faster is to use the same dictionary but mapped the reverse way. Always keeping the correct mapping table in memory will speed up processing here. # Update2: Done.
+    # Update3: str.translate() does the lookups for every character in C.
+    tempString = string.translate( fullWidthToHalfWidthAsciiTable )
 
     if debug == True:
-        print( tempString.encode( consoleEncoding ) )
+        # Only the debug message needs to know if there were any characters that could not be converted.
+        error = False
+        for i in string:
+            if not i in fullWidthToHalfWidthAsciiMap:
+                error = True
+                break
+        printToConsole( tempString )
         print( tempString == string )
         if error == True:
             # This will also error out if there are any characters that are already half width.
-            print( ( 'Warning, unable to convert all characters to half width in string: \'' + string + '\'' ).encode( consoleEncoding ) )
+            printToConsole( 'Warning, unable to convert all characters to half width in string: \'' + string + '\'' )
     return tempString
 
 
@@ -376,18 +400,18 @@ def checkIfThisFolderExists( myFolder ):
 #Errors out if myFile or myFolder does not exist.
 def verifyThisFileExists( myFile, nameOfFileToOutputInCaseOfError=None ):
     if myFile == None:
-        print( ( 'Error: Please specify a valid file for: ' + str( nameOfFileToOutputInCaseOfError ) ).encode( consoleEncoding ) )
+        printToConsole( 'Error: Please specify a valid file for: ' + str( nameOfFileToOutputInCaseOfError ) )
         sys.exit( 1 )
     if os.path.isfile( myFile ) != True:
-        print( ( 'Error: Unable to find file \'' + str( nameOfFileToOutputInCaseOfError ) + '\' ' ).encode( consoleEncoding ) )
+        printToConsole( 'Error: Unable to find file \'' + str( nameOfFileToOutputInCaseOfError ) + '\' ' )
         sys.exit( 1 )
 
 def verifyThisFolderExists( myFolder, nameOfFileToOutputInCaseOfError=None ):
     if myFolder == None:
-        print( ( 'Error: Please specify a valid folder for: ' + str( nameOfFileToOutputInCaseOfError ) ).encode( consoleEncoding ) )
+        printToConsole( 'Error: Please specify a valid folder for: ' + str( nameOfFileToOutputInCaseOfError ) )
         sys.exit( 1 )
     if os.path.isdir( myFolder ) != True:
-        print( ( 'Error: Unable to find folder \'' + str( nameOfFileToOutputInCaseOfError ) + '\' ' ).encode( consoleEncoding ) )
+        printToConsole( 'Error: Unable to find folder \'' + str( nameOfFileToOutputInCaseOfError ) + '\' ' )
         sys.exit( 1 )
 
 #Usage:
@@ -396,12 +420,34 @@ def verifyThisFolderExists( myFolder, nameOfFileToOutputInCaseOfError=None ):
 #verifyThisFileExists( myVar )
 
 
+# Settings files and dictionary spreadsheets write None, True, and False as text, so this maps the lowercase text to the value it stands for.
+stringsThatAreLiterals = { '' : None, 'none' : None, 'true' : True, 'false' : False }
+
+# This returns None, True, False, an int, or the original string depending upon what string contains. It does not strip whitespace.
+# Use one dictionary lookup instead of comparing string.lower() against each literal one at a time.
+def convertStringToValue( string ):
+    stringLowerCase = string.lower()
+    if stringLowerCase in stringsThatAreLiterals:
+        return stringsThatAreLiterals[ stringLowerCase ]
+    # Most values are either plain numbers or plain words, so check for those first instead of raising and catching an exception for every word.
+    # isdecimal() is only True for characters that int() accepts as digits, and int() never accepts letters, so neither check changes the result.
+    # Anything else, like signs, whitespace, or underscores, still goes through int() directly.
+    if string.isdecimal() == True:
+        return int( string )
+    if string.isalpha() == True:
+        return string
+    try:
+        return int( string ) # This will error out with data like '1.23', so floats get left as a string.
+    except:
+        return string
+
+
 # This function builds a Python dictionary from a text file and then returns it to the caller.
 # The idea is to read program settings from text files using a predetermined list of rules.
 # The text file uses the syntax: setting=value, # are comments, empty/whitespace lines ignored.
 def getDictionaryFromTextFile( fileNameWithPath, fileNameEncoding, consoleEncoding=consoleEncoding, errorHandlingType=inputErrorHandling, debug=debug ):
     if fileNameWithPath == None:
-        print( ( 'Warning: Cannot read settings from None entry: ' + str( fileNameWithPath ) ).encode( consoleEncoding ) )
+        printToConsole( 'Warning: Cannot read settings from None entry: ' + str( fileNameWithPath ) )
         return None
 
     verifyThisFileExists( fileNameWithPath, fileNameWithPath )
@@ -413,145 +459,96 @@ def getDictionaryFromTextFile( fileNameWithPath, fileNameEncoding, consoleEncodi
     # Okay, so the file was specified, it exists, and it was read from successfully. The contents are in inputFileContents.
     # Now turn inputFileContents into a dictionary.
     tempDictionary = {}
+    # The comment character and assignment operator do not change while reading the file, so only look them up once.
+    commentCharacter = linesThatBeginWithThisAreComments.strip()[ :1 ]
+    assignmentOperator = assignmentOperatorInSettingsFile
     for myLine in inputFileContents:
         # The line should be ignored if the first character is a comment character (after removing whitespace) or if there is only whitespace
-        ignoreCurrentLine = False
-        if ( myLine.strip() == '' ) or ( myLine.strip()[ :1 ] == linesThatBeginWithThisAreComments.strip()[ :1 ] ):
+        # Strip the line once and reuse it for every check below.
+        myLine = myLine.strip()
+        if ( myLine == '' ) or ( myLine[ :1 ] == commentCharacter ):
             continue
 
-        tempList = []
+        # if the line should not be ignored, then use = as a delimiter set each side as key = value in a temporaryDictionary
+        # Example:  paragraphDelimiter=emptyLine   #ignoreLinesThatStartWith=[ * ; 【     #wordWrap=45   #alwaysAddAfterTranslationEndOfLine=None
+        # partition() finds the delimiter and splits on it in one pass. The line was already stripped, so only the inner sides of key and value can have whitespace left.
+        key, separator, value = myLine.partition( assignmentOperator )
+
         # if line should not be ignored, then = must exist to use it as a delimitor. Exit due to malformed data if not found.
-        if myLine.find(assignmentOperatorInSettingsFile) == -1:
-            print( ( 'Error: Malformed data was found processing file: ' + fileNameWithPath + ' Missing: \'' + assignmentOperatorInSettingsFile + '\'').encode( consoleEncoding ) )
+        if separator == '':
+            printToConsole( 'Error: Malformed data was found processing file: ' + fileNameWithPath + ' Missing: \'' + assignmentOperator + '\'' )
             sys.exit( 1 )
 
-        # if the line should not be ignored, then use = as a delimiter set each side as key = value in a temporaryDictionary
-        # Example:  paragraphDelimiter=emptyLine   #ignoreLinesThatStartWith=[ * ; 【     #wordWrap=45   #alwaysAddAfterTranslationEndOfLine=None
-        key, value = myLine.split( assignmentOperatorInSettingsFile, 1 )
-        key = key.strip()
-        value = value.strip()
-        if value.lower() == '':
-            print( ( 'Warning: Error reading key\'s value \'' + key + '\' in file: ' + str(fileNameWithPath) + ' Using None as fallback.' ).encode( consoleEncoding ) )
-            value = None
-        elif value.lower() == 'none':
+        key = key.rstrip()
+        value = value.lstrip()
+        if value == '':
+            printToConsole( 'Warning: Error reading key\'s value \'' + key + '\' in file: ' + str(fileNameWithPath) + ' Using None as fallback.' )
             value = None
-        elif value.lower() == 'true':
-            value = True
-        elif value.lower() == 'false':
-            value = False
-        elif value.lower().count( ' ' ) > 0: # 'ignorelinesthatstartwith' # ignoreLinesThatStartWith This is a list that contains multiple entries.
+        elif value.count( ' ' ) > 0: # 'ignorelinesthatstartwith' # ignoreLinesThatStartWith This is a list that contains multiple entries.
             # then every item that is not blank space is a valid list value.
             tempList = value.split( ' ' )
             value = []
             # Extra whitespace between entries is hard to spot in the file and can produce malformed list entries, so parse each entry individually.
             for i in tempList:
                 if i != '':
-                    if i.lower() == 'true':
-                        value.append( True )
-                    elif i.lower() == 'false':
-                        value.append( False )
-                    elif i.lower() == 'none':
-                        value.append( None )
-                    else:
-                        try:
-                            value.append( int( i ) ) # This will error out with data like '1.23', so floats get left as a string.
-                        except:
-                            value.append( i )
+                    value.append( convertStringToValue( i ) )
         else:
-            try:
-                value = int( value )
-            except:
-                pass
+            # None, True, and False never contain a space, so checking for a list first does not change how they are read.
+            value = convertStringToValue( value )
         tempDictionary[ key ] = value
 
     #Finished reading entire file, so return resulting dictionary.
     if debug == True:
-        print( ( fileNameWithPath + ' was turned into this dictionary=' + str( tempDictionary ) ).encode( consoleEncoding ) )
+        printToConsole( fileNameWithPath + ' was turned into this dictionary=' + str( tempDictionary ) )
     return tempDictionary
 
 
+# The index of each name is the number of its month, so the name can be looked up directly instead of comparing against each month.
+monthNames = ( None, 'Jan', 'Feb', 'Mar', 'April', 'May', 'June', 'July', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec' )
+# Both '1' and '01' are accepted for single digit months.
+monthNumbersToNames = {}
+for monthNumber in range( 1, 13 ):
+    monthNumbersToNames[ str( monthNumber ) ] = monthNames[ monthNumber ]
+    monthNumbersToNames[ str( monthNumber ).zfill( 2 ) ] = monthNames[ monthNumber ]
+
 def getCurrentMonthFromNumbers( x ):
     x = str( x )
-    if ( x == '1' ) or ( x == '01' ):
-        return 'Jan'
-    elif ( x == '2' ) or ( x == '02' ):
-        return 'Feb'
-    elif ( x == '3' ) or ( x == '03' ):
-        return 'Mar'
-    elif ( x == '4' ) or ( x == '04' ):
-        return 'April'
-    elif ( x == '5' ) or ( x == '05' ):
-        return 'May'
-    elif ( x == '6' ) or ( x == '06' ):
-        return 'June'
-    elif ( x == '7' ) or ( x == '07' ):
-        return 'July'
-    elif ( x == '8' ) or ( x == '08' ):
-        return 'Aug'
-    elif ( x == '9' ) or ( x == '09' ):
-        return 'Sept'
-    elif ( x == '10' ):
-        return 'Oct'
-    elif ( x == '11' ):
-        return 'Nov'
-    elif ( x == '12' ):
-        return 'Dec'
-    else:
+    if x not in monthNumbersToNames:
         print( 'Unspecified error..' )
         sys.exit( 1 )
+    return monthNumbersToNames[ x ]
 
 # These functions return the current date, time, yesterday's date, and full (day+time)
+# Each one formats all of its fields with a single strftime() call instead of one strftime() call per field.
 def getYearMonthAndDay():
-    today = datetime.datetime.today()
-
-    #debug code
-    #print(datetime.today().strftime('%Y-%m-%d'))
-    #print(today.strftime("%d/%m/%Y %H:%M:%S"))
-
-    currentYear = str( today.strftime( '%Y' ) )
-#    currentMonth = getCurrentMonthFromNumbers( today.strftime( '%m' ) )
-    currentMonth = str( today.strftime( '%m' ) )
-    currentDay = str( today.strftime( '%d' ) )
-    return currentYear + '-' + currentMonth + '-' + currentDay
+    return datetime.datetime.today().strftime( '%Y-%m-%d' )
 
 
 def getYesterdaysDate():
     yesterday = datetime.datetime.today() - datetime.timedelta( 1 )
-
-    #debug code
-    #print(datetime.yesterday().strftime('%Y-%m-%d'))
-    #print(yesterday.strftime("%d/%m/%Y %H:%M:%S"))
-
-    currentYear = str( yesterday.strftime( '%Y' ) )
-    currentMonth = getCurrentMonthFromNumbers( yesterday.strftime( '%m' ) )
-    currentMonth = str( yesterday.strftime( '%m' ) )
-    currentDay = str( yesterday.strftime( '%d' ) )
-    return currentYear + '-' + currentMonth + '-' + currentDay
+    return yesterday.strftime( '%Y-%m-%d' )
 
 
 def getCurrentTime():
-    today = datetime.datetime.today()
-
-    currentHour = today.strftime('%H')
-    currentMinutes = today.strftime('%M')
-    currentSeconds = today.strftime('%S')
-    return currentHour + '-' + currentMinutes + '-' + currentSeconds
+    return datetime.datetime.today().strftime( '%H-%M-%S' )
 
 
+# This does not call getYearMonthAndDay() and getCurrentTime() so the date and time both come from the same moment.
 def getDateAndTimeFull():
-    #currentDateAndTimeFull=currentDateFull+'-'+currentTimeFull
-    return getYearMonthAndDay() + '.' + getCurrentTime()
+    return datetime.datetime.today().strftime( '%Y-%m-%d.%H-%M-%S' )
 
 #if ( verbose == True ) or ( debug == True ):
 #    print( currentDateAndTimeFull.encode( consoleEncoding ) )
 
 
 # Returns True if internet is available. Returns false otherwise.
+# Opening a TCP connection is enough to know the domain resolved and that the server is reachable, so there is no need to also do a TLS handshake and download a web page.
 def checkIfInternetIsAvailable():
     try:
-        requests.get( domainWithProtocolToResolveForInternetConnectivity , allow_redirects=True, timeout=( 5, defaultTimeout ) )
+        with socket.create_connection( ( domainWithoutProtocolToResolveForInternetConnectivity, portToConnectToForInternetConnectivity ), timeout=defaultTimeout ):
+            pass
         return True
-    except:
+    except OSError:
         return False
 
 
@@ -562,60 +559,64 @@ def importDictionaryFromFile( myFile, encoding=defaultTextFileEncoding ):
     myFileNameOnly, myFileExtensionOnly = os.path.splitext(myFile)
     if ( myFileExtensionOnly == None ) or ( myFileExtensionOnly == '' ):
         return None
-    elif myFileExtensionOnly == '.csv':
-        return importDictionaryFromCSV( myFile, myFileEncoding=encoding, ignoreWhitespace=False )
-    elif myFileExtensionOnly == '.xlsx':
-        return importDictionaryFromXLSX( myFile, myFileEncoding=encoding )
-    elif myFileExtensionOnly == '.xls':
-        return importDictionaryFromXLS( myFile, myFileEncoding=encoding )
-    elif myFileExtensionOnly == '.ods':
-        return importDictionaryFromODS( myFile, myFileEncoding=encoding )
-    elif myFileExtensionOnly == '.tsv':
-        return importDictionaryFromTSV( myFile, myFileEncoding=encoding, ignoreWhitespace=False )
+    elif myFileExtensionOnly in importDictionaryFunctions:
+        # The .csv and .tsv importers also take ignoreWhitespace, which defaults to False.
+        return importDictionaryFunctions[ myFileExtensionOnly ]( myFile, myFileEncoding=encoding )
     else:
-        print( ('Warning: Unrecognized extension for file: ' + str( myFile ) ).encode( consoleEncoding ) )
+        printToConsole( 'Warning: Unrecognized extension for file: ' + str( myFile ) )
         return None
         # Alternatively, this could assume it is dealing with a text file that conforms to the key=value pairs syntax that also has # as comments. These files should also return dictionaries or None if there are any malformed entries. However, since that is less clear, a Warning: should probably be printed here since this code is not really meant to be called this way. Then again, having flexible code is a good thing. 
         # readSettingsFromTextFile() would need to be updated to soft-fail by returning None instead of crashing the program on malformed data. Does updating it that way make sense? A strict=True, flag could be added to toggle this behavior without changing existing calling code, but changing the source to be strict about it is probably for the better.
 
 
 # Even if importing to a Python dictionary from .csv .xlsx .xls .ods .tsv, the rule is that the first entry for spreadsheets is headers, so the first key=value entry must be skipped regardless.
-def importDictionaryFromCSV( myFile, myFileEncoding=defaultTextFileEncoding, ignoreWhitespace=False ):
+# csvDialect can be any dialect the csv library knows about, like 'excel' or 'excel-tab'. None uses the csv library default.
+def importDictionaryFromCSV( myFile, myFileEncoding=defaultTextFileEncoding, ignoreWhitespace=False, csvDialect=None ):
     tempDict = {}
 
     # 'with' is correct. Do not use 'while'.
     with open(myFile, 'rt', newline='', encoding=myFileEncoding, errors=inputErrorHandling) as myFileHandle:
-        csvReader = csv.reader( myFileHandle )
-        for currentLine,line in enumerate( csvReader ):
-            # Skip first line.
-            if currentLine == 0:
-                pass
-            elif currentLine != 0:
-                if ignoreWhitespace == True:
-                    for i in range( len( line ) ):
-                        line[ i ] = line[ i ].strip()
-                if line[ 1 ] == '':
-                    line[ 1 ] = None
-                elif line[ 1 ].lower() == 'none':
-                    line[ 1 ] = None
-                elif line[ 1 ].lower() == 'true':
-                    line[ 1 ] = True
-                elif line[ 1 ].lower() == 'false':
-                    line[ 1 ] = False
-                else:
-                    try:
-                        line[ 1 ] = int( line[ 1 ] )
-                    except:
-                        pass
-                tempDict[ line[ 0 ] ] = line[ 1 ]
+        if csvDialect == None:
+            csvReader = csv.reader( myFileHandle )
+        else:
+            csvReader = csv.reader( myFileHandle, dialect=csvDialect )
+        # Skip first line. Reading it before the loop means the rows that remain do not need to be checked for it one at a time.
+        next( csvReader, None )
+        for line in csvReader:
+            if ignoreWhitespace == True:
+                line = [ i.strip() for i in line ]
+            line[ 1 ] = convertStringToValue( line[ 1 ] )
+            tempDict[ line[ 0 ] ] = line[ 1 ]
 
     return tempDict
 
 
+# The first column is the key and the second column is the value. Like for .csv files, the first row is headers and is skipped.
 def importDictionaryFromXLSX( myFile, myFileEncoding=defaultTextFileEncoding ):
-    print( 'Hello World.' )
-    workbook = openpyxl.load_workbook( filename=myFile ) #, data_only=)
-    spreadsheet = workbook.active
+    import openpyxl
+    tempDict = {}
+
+    # https://openpyxl.readthedocs.io/en/stable/optimized.html
+    # read_only mode parses the rows lazily instead of building every cell up front, and values_only returns the values directly instead of Cell objects.
+    # data_only=True is not used for the same reason as in chocolate.py. Files written by openpyxl do not have cached values for cells that start with = .
+    workbook = openpyxl.load_workbook( filename=myFile, read_only=True )
+    rows = workbook.active.iter_rows( values_only=True )
+    next( rows, None )
+    for row in rows:
+        if ( len( row ) == 0 ) or ( row[ 0 ] == None ):
+            continue
+        if len( row ) > 1:
+            value = row[ 1 ]
+        else:
+            value = None
+        # Cells that are numbers or booleans already have the correct type. Text cells are converted the same way as values read from .csv files.
+        if isinstance( value, str ):
+            value = convertStringToValue( value )
+        tempDict[ row[ 0 ] ] = value
+    # read_only requires closing the workbook after use.
+    workbook.close()
+
+    return tempDict
 
 
 def importDictionaryFromXLS( myFile, myFileEncoding=defaultTextFileEncoding ):
@@ -626,6 +627,16 @@ def importDictionaryFromODS( myFile, myFileEncoding=defaultTextFileEncoding ):
     print( 'Hello World.' )
 
 
+# .tsv files are .csv files that use tabs instead of commas, so read them the same way and return the same plain dictionary.
 def importDictionaryFromTSV( myFile, myFileEncoding=defaultTextFileEncoding, ignoreWhitespace=False ):
-    print( 'Hello World.' )
+    return importDictionaryFromCSV( myFile, myFileEncoding=myFileEncoding, ignoreWhitespace=ignoreWhitespace, csvDialect='excel-tab' )
+
 
+# importDictionaryFromFile() uses this to find the import function for each extension. It is defined here since the functions must exist first.
+importDictionaryFunctions = {
+'.csv' : importDictionaryFromCSV,
+'.xlsx' : importDictionaryFromXLSX,
+'.xls' : importDictionaryFromXLS,
+'.ods' : importDictionaryFromODS,
+'.tsv' : importDictionaryFromTSV
+}
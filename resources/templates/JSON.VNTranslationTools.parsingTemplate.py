@@ -55,10 +55,7 @@ import resources.chocolate as chocolate            # Main data structure that wr
 # import chocolate
 
 #Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling = 'namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling = 'backslashreplace'    
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
 
 
 """
@@ -81,6 +78,8 @@ settings[ 'fileEncoding' ] - The encoding of rawFile as a string.
 settings[ 'parseSettingsDictionary' ] - The parsingTemplate.ini file as a Python dictionary.
 settings[ 'outputColumn' ] - The columnToUseForReplacements from the CLI as a string. If a number was specified, it can be converted back using int( settings[ 'outputColumn' ] ) . If one was not specified, then settings[ 'outputColumnIsDefault' ] == True.
 settings[ 'translatedRawFileName' ] - The filename and path of the file to use when writing the translated file as output.
+settings[ 'rawFileLineEndings' ] - The line endings of rawFile, like '\r\n' or '\n'. This is only available in output(). input() does not get it.
+settings[ 'characterDictionaryRegex' ] - None or a compiled regular expression that matches any name in characterDictionary, longest names first. To replace every name in a string in one pass: settings[ 'characterDictionaryRegex' ].sub( lambda match: characterDictionary[ match.group() ], myString )
 
 Spreadsheet formatting suggestion: https://github.com/gdiaz384/py3TranslateLLM#regarding-the-spreadsheet-formats
 The format is based on the format used by VNT, T++, and common sense.
@@ -99,7 +98,7 @@ Example lists that represent a row for different types of data:
 def input( fileNameWithPath, characterDictionary=None, settings={} ):
 
     if debug == True:
-        print( ( 'characterDictionary=' + str(characterDictionary) ).encode(consoleEncoding) )
+        chocolate.printToConsole( 'characterDictionary=' + str(characterDictionary) )
 
     # Unpack some variables.
     if 'fileEncoding' in settings:
@@ -129,11 +128,11 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
         print( type( inputFileContentsJSON ) )  #This is a list
         print( type( inputFileContentsJSON[0] ) )  #This is a dictionary.
 
-        print( str(inputFileContentsJSON).encode(consoleEncoding) )
+        chocolate.printToConsole( str(inputFileContentsJSON) )
         #print( str(inputFileContentsJSON[1]).encode(consoleEncoding) )
 
         print (type(inputFileContentsJSON))
-        print( str(inputFileContentsJSON).encode(consoleEncoding) )
+        chocolate.printToConsole( str(inputFileContentsJSON) )
 
 #    sys.exit(1)
 
@@ -156,7 +155,7 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
             if tempSpeaker in characterDictionary.keys():
                 tempSpeaker = characterDictionary[ tempSpeaker ]
             else:
-                print( ('Warning: The following speaker was not found in the character Dictionary:' + str(tempSpeaker) ).encode(consoleEncoding) )
+                chocolate.printToConsole( 'Warning: The following speaker was not found in the character Dictionary:' + str(tempSpeaker) )
 
         # Once dictionary has finished processing a list entry, append the entry to temporaryList and increment entryNumber.
         temporaryList.append( [ tempDialogueLine, tempSpeaker, str(entryNumber) ] )
@@ -166,10 +165,10 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
         #print( 'value=' + value )
 
     if debug == True:
-        print( str(temporaryList).encode(consoleEncoding) )
+        chocolate.printToConsole( str(temporaryList) )
         #sys.exit(0)
 
-    print( ('Finished reading input of:' + fileNameWithPath).encode(consoleEncoding))
+    chocolate.printToConsole( 'Finished reading input of:' + fileNameWithPath )
 
     # Debug code.
     #sys.exit(0)
@@ -239,7 +238,7 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
                         outputColumn = int(settings[ 'outputColumn' ])
                     except:
                         outputColumn = len( mySpreadsheet.getRow(1) )
-                        print( ('Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' ).encode(consoleEncoding) )
+                        chocolate.printToConsole( 'Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' )
         # if settings[ 'outputColumn' ] is not an integer or string, then give up and use a default value.
         else:
             #outputColumn=defaultOutputColumn
@@ -305,9 +304,9 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
         except:
             if input.find('\n') == -1:
                 print( 'Error: Assertion failed. assert input == inputFileContentsJSON[currentJSONEntry][message].strip()' )
-                print( ('Input=' + input).encode(consoleEncoding) )
-                print( ('message=' + inputFileContentsJSON[currentJSONEntry]['message'].strip() ).encode(consoleEncoding) )
-                print( ('Output=' + str(output) ).encode(consoleEncoding) )
+                chocolate.printToConsole( 'Input=' + input )
+                chocolate.printToConsole( 'message=' + inputFileContentsJSON[currentJSONEntry]['message'].strip() )
+                chocolate.printToConsole( 'Output=' + str(output) )
                 sys.exit(1)
 
             # The input gets processed but not actually modified. The line breaks are still present as \n. However, the original file has new lines as \r\n, so \n alone will not match. Convert back for comparison.
@@ -316,9 +315,9 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
                 assert input == inputFileContentsJSON[currentJSONEntry]['message'].strip()
             except:
                 print( 'Error: Assertion failed. assert input == inputFileContentsJSON[currentJSONEntry][message].strip()' )
-                print( ('Input=' + input).encode(consoleEncoding) )
-                print( ('message=' + inputFileContentsJSON[currentJSONEntry]['message'].strip() ).encode(consoleEncoding) )
-                print( ('Output=' + str(output) ).encode(consoleEncoding) )
+                chocolate.printToConsole( 'Input=' + input )
+                chocolate.printToConsole( 'message=' + inputFileContentsJSON[currentJSONEntry]['message'].strip() )
+                chocolate.printToConsole( 'Output=' + str(output) )
                 sys.exit(1)
 
         if ( output != None ) and ( output != '' ):
@@ -344,7 +343,7 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
             if inputFileContentsJSON[currentJSONEntry]['name'] in settings[ 'characterDictionary' ]:
                 inputFileContentsJSON[currentJSONEntry]['name']=settings[ 'characterDictionary' ][ inputFileContentsJSON[currentJSONEntry][ 'name' ] ]
             else:
-                print( ('Warning: Unable to find character name in character dictionary: ' + inputFileContentsJSON[currentJSONEntry][ 'name' ] ).encode(consoleEncoding) )
+                chocolate.printToConsole( 'Warning: Unable to find character name in character dictionary: ' + inputFileContentsJSON[currentJSONEntry][ 'name' ] )
 
         currentJSONEntry+=1
 
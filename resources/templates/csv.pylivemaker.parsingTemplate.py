@@ -64,10 +64,7 @@ import resources.functions as functions              # A helper library that has
 # import functions
 
 #Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling = 'namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling = 'backslashreplace'    
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
 
 
 """
@@ -90,6 +87,8 @@ settings[ 'fileEncoding' ] - The encoding of rawFile as a string.
 settings[ 'parseSettingsDictionary' ] - The parsingTemplate.ini file as a Python dictionary.
 settings[ 'outputColumn' ] - The columnToUseForReplacements from the CLI as a string. If a number was specified, it can be converted back using int( settings[ 'outputColumn' ] ) . If one was not specified, then settings[ 'outputColumnIsDefault' ] == True.
 settings[ 'translatedRawFileName' ] - The filename and path of the file to use when writing the translated file as output.
+settings[ 'rawFileLineEndings' ] - The line endings of rawFile, like '\r\n' or '\n'. This is only available in output(). input() does not get it.
+settings[ 'characterDictionaryRegex' ] - None or a compiled regular expression that matches any name in characterDictionary, longest names first. To replace every name in a string in one pass: settings[ 'characterDictionaryRegex' ].sub( lambda match: characterDictionary[ match.group() ], myString )
 
 Spreadsheet formatting suggestion: https://github.com/gdiaz384/py3TranslateLLM#regarding-the-spreadsheet-formats
 The format is based on the format used by VNT, T++, and common sense.
@@ -108,7 +107,7 @@ Example lists that represent a row for different types of data:
 def input( fileNameWithPath, characterDictionary=None, settings={} ):
 
     if debug == True:
-        print( ( 'characterDictionary=' + str( characterDictionary ) ).encode( consoleEncoding ) )
+        chocolate.printToConsole( 'characterDictionary=' + str( characterDictionary ) )
 
     # Unpack some variables.
     if 'fileEncoding' in settings:
@@ -219,7 +218,7 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
                         outputColumn = int(settings[ 'outputColumn' ])
                     except:
                         outputColumn = len( mySpreadsheet.getRow(1) )
-                        print( ('Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' ).encode(consoleEncoding) )
+                        chocolate.printToConsole( 'Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' )
         # if settings[ 'outputColumn' ] is not an integer or string, then give up and use a default value.
         else:
             #outputColumn=defaultOutputColumn
@@ -83,10 +83,7 @@ import ebooklib.epub
 import bs4
 
 # Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling='namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling='backslashreplace'    
+outputErrorHandling='namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
 
 
 """
@@ -109,6 +106,8 @@ settings[ 'fileEncoding' ] - The encoding of rawFile as a string.
 settings[ 'parseSettingsDictionary' ] - The parsingTemplate.ini file as a Python dictionary.
 settings[ 'outputColumn' ] - The columnToUseForReplacements from the CLI as a string. If a number was specified, it can be converted back using int( settings[ 'outputColumn' ] ) . If one was not specified, then settings[ 'outputColumnIsDefault' ] == True.
 settings[ 'translatedRawFileName' ] - The filename and path of the file to use when writing the translated file as output.
+settings[ 'rawFileLineEndings' ] - The line endings of rawFile, like '\r\n' or '\n'. This is only available in output(). input() does not get it.
+settings[ 'characterDictionaryRegex' ] - None or a compiled regular expression that matches any name in characterDictionary, longest names first. To replace every name in a string in one pass: settings[ 'characterDictionaryRegex' ].sub( lambda match: characterDictionary[ match.group() ], myString )
 
 Spreadsheet formatting suggestion: https://github.com/gdiaz384/py3TranslateLLM#regarding-the-spreadsheet-formats
 The format is based on the format used by VNT, T++, and common sense.
@@ -127,7 +126,7 @@ Example lists that represent a row for different types of data:
 def input( fileNameWithPath, characterDictionary=None, settings={} ):
 
     if debug == True:
-        print( ( 'characterDictionary=' + str(characterDictionary) ).encode(consoleEncoding) )
+        chocolate.printToConsole( 'characterDictionary=' + str(characterDictionary) )
 
     # Unpack some variables.
     if 'fileEncoding' in settings:
@@ -148,9 +147,9 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
 
     # https://docs.sourcefabric.org/projects/ebooklib/en/latest/ebooklib.html
     myEbook = ebooklib.epub.read_epub(fileNameWithPath) # (, encoding=fileEncoding) #No encoding information? Are all ebooks always utf-8?
-    print( ('myEbook.title=' + str(myEbook.title) ).encode(consoleEncoding) )
-    print( ('myEbook.version=' + str(myEbook.version) ).encode(consoleEncoding) )
-    print( ('myEbook.uid=' + str(myEbook.uid) ).encode(consoleEncoding) )
+    chocolate.printToConsole( 'myEbook.title=' + str(myEbook.title) )
+    chocolate.printToConsole( 'myEbook.version=' + str(myEbook.version) )
+    chocolate.printToConsole( 'myEbook.uid=' + str(myEbook.uid) )
 
     # This returns file names. 9 means 'ITEM_DOCUMENT'
     #myEbook.get_items_of_type(9)
@@ -241,7 +240,7 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
                         outputColumn = int(settings[ 'outputColumn' ])
                     except:
                         outputColumn = len( mySpreadsheet.getRow(1) )
-                        print( ('Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' ).encode(consoleEncoding) )
+                        chocolate.printToConsole( 'Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' )
         # if settings[ 'outputColumn' ] is not an integer or string, then give up and use a default value.
         else:
             #outputColumn=defaultOutputColumn
@@ -290,9 +289,9 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
     print( 'Reading ebook...' )
     # https://docs.sourcefabric.org/projects/ebooklib/en/latest/ebooklib.html
     myEbook = ebooklib.epub.read_epub(fileNameWithPath) # (, encoding=fileEncoding) #No encoding information? Are all ebooks always utf-8? Maybe the encoding is set by the inner .html files or per file.
-    print( ('myEbook.title=' + str(myEbook.title) ).encode(consoleEncoding) )
-    print( ('myEbook.version=' + str(myEbook.version) ).encode(consoleEncoding) )
-    print( ('myEbook.uid=' + str(myEbook.uid) ).encode(consoleEncoding) )
+    chocolate.printToConsole( 'myEbook.title=' + str(myEbook.title) )
+    chocolate.printToConsole( 'myEbook.version=' + str(myEbook.version) )
+    chocolate.printToConsole( 'myEbook.uid=' + str(myEbook.uid) )
 
     # This returns file names. 9 means 'ITEM_DOCUMENT'
     #myEbook.get_items_of_type( 9 )
@@ -360,7 +359,7 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
     else:
         outputFileName=fileNameWithPath + '.translated' + pathlib.Path(fileToTranslateFileName).suffix
     ebooklib.epub.write_epub( outputFileName, myEbook )
-    print( ( 'Wrote: ' + outputFileName ).encode(consoleEncoding) )
+    chocolate.printToConsole( 'Wrote: ' + outputFileName )
 
     # return None to calling function.
     return None
@@ -433,7 +432,7 @@ def parseXHTML( fileName, fileContents ):
 
     #print(fileContents)
     #print(mySoup)
-    print( str(fileName).encode(consoleEncoding) )
+    chocolate.printToConsole( str(fileName) )
     temporaryList=[]
 
     for counter,item in enumerate( mySoup.select('body p') ): # Perfect.
@@ -702,7 +701,7 @@ def insertIntoXHTML(filename, fileContents, parsedList ):
 
     #print(fileContents)
     #print(mySoup)
-    print( str(filename).encode(consoleEncoding) )
+    chocolate.printToConsole( str(filename) )
 
     # Use the for i in soup.select(): i.replace_with() syntax to update the soup.
     # https://stackoverflow.com/questions/40775930/using-beautifulsoup-to-modify-html
@@ -45,10 +45,7 @@ import resources.chocolate as chocolate     # Main data structure that wraps ope
 
 
 #Using the 'namereplace' error handler for text encoding requires Python 3.5+, so use an older one if necessary.
-if sys.version_info.minor >= 5:
-    outputErrorHandling = 'namereplace'
-elif sys.version_info.minor < 5:
-    outputErrorHandling = 'backslashreplace'    
+outputErrorHandling = 'namereplace' if sys.version_info >= (3, 5) else 'backslashreplace'
 
 """
 Development Guide:
@@ -70,6 +67,8 @@ settings[ 'fileEncoding' ] - The encoding of rawFile as a string.
 settings[ 'parseSettingsDictionary' ] - The parsingTemplate.ini file as a Python dictionary.
 settings[ 'outputColumn' ] - The columnToUseForReplacements from the CLI as a string. If a number was specified, it can be converted back using int( settings[ 'outputColumn' ] ) . If one was not specified, then settings[ 'outputColumnIsDefault' ] == True.
 settings[ 'translatedRawFileName' ] - The filename and path of the file to use when writing the translated file as output.
+settings[ 'rawFileLineEndings' ] - The line endings of rawFile, like '\r\n' or '\n'. This is only available in output(). input() does not get it.
+settings[ 'characterDictionaryRegex' ] - None or a compiled regular expression that matches any name in characterDictionary, longest names first. To replace every name in a string in one pass: settings[ 'characterDictionaryRegex' ].sub( lambda match: characterDictionary[ match.group() ], myString )
 
 Spreadsheet formatting suggestion: https://github.com/gdiaz384/py3TranslateLLM#regarding-the-spreadsheet-formats
 The format is based on the format used by VNT, T++, and common sense.
@@ -88,7 +87,7 @@ Example lists that represent a row for different types of data:
 def input( fileNameWithPath, characterDictionary=None, settings={} ):
 
     if debug == True:
-        print( ( 'characterDictionary=' + str(characterDictionary) ).encode(consoleEncoding) )
+        chocolate.printToConsole( 'characterDictionary=' + str(characterDictionary) )
 
     # Unpack some variables.
     if 'fileEncoding' in settings:
@@ -158,8 +157,8 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
                     if ( entry.find(startDelimiterForCharaName ) != -1 ) and ( entry.find(endDelimiterForCharaName) != -1 ) and ( entry.find(startDelimiterForCharaName) < entry.find(endDelimiterForCharaName) ):
                         characterName=entry[ entry.find(startDelimiterForCharaName)+len(startDelimiterForCharaName) : entry.find(endDelimiterForCharaName) ]
                         if debug == True:
-                            print( ('characterName=' + characterName).encode(consoleEncoding) )
-                            print( ( str(entry.find(startDelimiterForCharaName)+len(startDelimiterForCharaName)) + ',' + str( entry.find(endDelimiterForCharaName)) ).encode(consoleEncoding)  )
+                            chocolate.printToConsole( 'characterName=' + characterName )
+                            chocolate.printToConsole( str(entry.find(startDelimiterForCharaName)+len(startDelimiterForCharaName)) + ',' + str( entry.find(endDelimiterForCharaName)) )
                         #print( entry.encode(consoleEncoding) )
                         #print( entry[entry.find(startDelimiterForCharaName)+len(startDelimiterForCharaName)] ) )
                         break
@@ -167,7 +166,7 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
         #debug code
         #print only if debug option specified
         if debug == True:
-            print(myLine.encode(consoleEncoding)) #prints line that is currently being processed
+            chocolate.printToConsole( myLine ) #prints line that is currently being processed
         #myLine[:1]# This gets only the first character of a string #What will this output if a line contains only whitespace or only a new line? # Answer: '' -an empty string for new lines, but probably the whitespace for lines with whitespace.
         #if myLine[:1].strip() != '':# if the first character is not empty or filled with whitespace
         #    if debug == True:
@@ -207,7 +206,7 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
                                if j == myLine.strip()[ :len( j ) ]:
                                     #print('pie3')
                                     if debug == True:
-                                        print( ('Re-adding line: '+myLine.strip() ).encode(consoleEncoding) )
+                                        chocolate.printToConsole( 'Re-adding line: '+myLine.strip() )
                                     thisLineIsValid=True
 
         if thisLineIsValid == False: 
@@ -242,7 +241,7 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
                 currentParagraphLineCount += 1
             else:
                 #print('pie')
-                sys.exit('Unspecified error.'.encode(consoleEncoding))
+                sys.exit( 'Unspecified error.' )
 
             #if max paragraph limit has been reached
             if (currentParagraphLineCount >= int( parseSettingsDictionary['maximumNumberOfLinesPerParagraph'] ) ) or (parseSettingsDictionary['paragraphDelimiter'] == 'newLine'):  
@@ -260,7 +259,7 @@ def input( fileNameWithPath, characterDictionary=None, settings={} ):
                 characterName = None
         else:
             #print('pie2')
-            sys.exit('Unspecified error.'.encode(consoleEncoding))
+            sys.exit( 'Unspecified error.' )
 
         if currentLineNumberWasUpdated == False:
             currentLineNumber+=1
@@ -345,7 +344,7 @@ def output( fileNameWithPath, mySpreadsheet, characterDictionary=None, settings=
                         outputColumn = int(settings[ 'outputColumn' ])
                     except:
                         outputColumn = len( mySpreadsheet.getRow(1) )
-                        print( ('Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' ).encode(consoleEncoding) )
+                        chocolate.printToConsole( 'Warning: Could not find column \'' + settings[ 'outputColumn' ] + '\' in spreadsheet. Using furthest right column value \'' + str(outputColumn) + ':'+ str( mySpreadsheet.getColumn(outputColumn)[0] ) + '\'' )
         # if settings[ 'outputColumn' ] is not an integer or string, then give up and use a default value.
         else:
             #outputColumn=defaultOutputColumn